@@ -0,0 +1,346 @@
+"""
+CopilotKit 내부 증분(incremental) 툴 인자 JSON 파서
+
+predict_state는 ACTION_EXECUTION_ARGS 청크가 도착할 때마다 툴 호출
+인자 JSON의 "지금까지 파싱 가능한 부분"이 필요합니다. 누적 버퍼 전체를
+매번 다시 파싱하면 N개 청크 스트림에서 총 O(N²)의 작업이 되므로, 이
+모듈은 토크나이저 상태(컨테이너 스택, 문자열/이스케이프/숫자 모드)를
+호출 사이에 유지하면서 새 청크의 바이트만 소비하는 단일 패스 상태
+기계를 제공합니다.
+
+파싱 중간 결과는 `args` 딕셔너리에 제자리(in-place)로 반영됩니다:
+완성된 키-값 쌍은 즉시 기록되고, 진행 중인 문자열 값은 feed() 호출이
+끝날 때마다 부분 문자열로 노출됩니다 (기존 PartialJSONParser와 같은
+관찰 가능 동작). 숫자/리터럴(true/false/null)은 구분자를 만나 완성된
+시점에만 기록됩니다 — 청크 경계에서 잘린 숫자를 잘못된 값으로 노출하지
+않기 위해서입니다.
+
+Examples
+--------
+>>> parser = IncrementalToolArgsParser()
+>>> parser.feed('{"name": "Al')
+True
+>>> parser.args
+{'name': 'Al'}
+>>> parser.feed('ice", "age": 3')
+True
+>>> parser.args
+{'name': 'Alice'}
+>>> parser.feed('0}')
+True
+>>> parser.args
+{'name': 'Alice', 'age': 30}
+
+See Also
+--------
+copilotkit.runloop.predict_state : 이 파서의 유일한 내부 사용처
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# 파서 상태 (모듈 내부 전용)
+_EXPECT_VALUE = 0      # 값 시작 대기 ({, [, ", 숫자, 리터럴)
+_IN_STRING = 1         # 문자열 내부 (키 또는 값)
+_IN_ESCAPE = 2         # 문자열 내부, 역슬래시 직후
+_IN_UNICODE = 3        # \uXXXX 16진수 4자리 수집 중
+_IN_NUMLIT = 4         # 숫자 또는 true/false/null 누적 중
+_AFTER_VALUE = 5       # 값 완료, ',' 또는 닫는 괄호 대기
+_EXPECT_KEY = 6        # 객체 키 문자열 대기 ('}'도 허용)
+_EXPECT_COLON = 7      # 키 완료, ':' 대기
+
+_ESCAPES = {
+    '"': '"', "\\": "\\", "/": "/",
+    "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
+
+_WHITESPACE = " \t\n\r"
+
+_NUMLIT_CHARS = frozenset("-+.eE0123456789truefalsn")
+
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class IncrementalToolArgsParser:
+    """
+    단일 툴 호출 인자 객체용 스트리밍 JSON 파서
+
+    ACTION_EXECUTION_START마다 새 인스턴스를 만들고, ARGS 청크가 올
+    때마다 feed()에 해당 청크만 넘깁니다. 파싱된 (부분) 인자는 `args`
+    딕셔너리로 항상 조회 가능하며, 같은 딕셔너리 객체가 제자리에서
+    갱신됩니다.
+
+    Attributes
+    ----------
+    args : Dict[str, Any]
+        지금까지 파싱된 최상위 인자 딕셔너리 (제자리 갱신)
+
+    Raises
+    ------
+    ValueError
+        feed()에 JSON 문법상 올 수 없는 문자가 들어온 경우.
+        한 번 실패한 파서는 이후 feed()도 동일하게 실패합니다.
+    """
+
+    __slots__ = (
+        "args", "_stack", "_state", "_sbuf", "_is_key",
+        "_ubuf", "_nbuf", "_placed", "_broken", "_started", "_str_grew",
+        "_pending_hi",
+    )
+
+    def __init__(self) -> None:
+        self.args: Dict[str, Any] = {}
+        # 프레임: (컨테이너, 대기 중인 키) — 리스트 프레임의 키는 None
+        self._stack: List[Tuple[Any, Optional[str]]] = []
+        self._state = _EXPECT_VALUE
+        self._sbuf: List[str] = []      # 디코딩된 문자열 문자 누적
+        self._is_key = False            # 현재 문자열이 객체 키인지
+        self._ubuf = ""                 # \uXXXX 16진수 누적
+        self._nbuf: List[str] = []      # 숫자/리터럴 문자 누적
+        self._placed = False            # 진행 중 부분 값을 이미 배치했는지
+        self._broken = False
+        self._str_grew = False      # 이번 feed에서 문자열 값이 늘었는지
+        self._started = False           # 루트 '{'를 소비했는지
+        self._pending_hi: Optional[int] = None  # 짝 대기 중인 하이 서로게이트
+
+    def feed(self, chunk: str) -> bool:
+        """
+        새 청크를 소비하고 `args`에 변화가 있었는지 반환합니다.
+
+        Parameters
+        ----------
+        chunk : str
+            ACTION_EXECUTION_ARGS 이벤트의 args 델타 (누적 버퍼 아님)
+
+        Returns
+        -------
+        bool
+            이번 호출로 `args`의 관찰 가능한 내용이 바뀌었으면 True.
+            공백뿐인 청크나 잘린 숫자 중간 등에서는 False — 호출 측은
+            이때 상태 메시지 방출을 건너뛸 수 있습니다.
+        """
+        if self._broken:
+            raise ValueError("parser is in a failed state")
+        dirty = False
+        self._str_grew = False
+        try:
+            for ch in chunk:
+                dirty |= self._consume(ch)
+            # feed 경계에서 진행 중인 문자열 값을 부분 노출
+            # (이번 청크가 문자열을 실제로 늘렸을 때만)
+            if self._str_grew and not self._is_key and self._sbuf \
+                    and self._state in (_IN_STRING, _IN_ESCAPE, _IN_UNICODE):
+                self._place("".join(self._sbuf), final=False)
+                dirty = True
+        except ValueError:
+            self._broken = True
+            raise
+        return dirty
+
+    # ------------------------------------------------------------------
+    # 문자 단위 상태 전이
+    # ------------------------------------------------------------------
+
+    def _consume(self, ch: str) -> bool:
+        state = self._state
+
+        if state == _IN_STRING:
+            if ch == "\\":
+                self._state = _IN_ESCAPE
+                return False
+            # 이스케이프가 아닌 문자: 대기 중인 하이 서로게이트는 짝이 없음
+            if self._pending_hi is not None:
+                self._flush_lone_surrogate()
+            if ch == '"':
+                return self._end_string()
+            self._sbuf.append(ch)
+            self._str_grew = True
+            return False
+
+        if state == _IN_ESCAPE:
+            if ch == "u":
+                self._state = _IN_UNICODE
+                self._ubuf = ""
+            else:
+                if self._pending_hi is not None:
+                    self._flush_lone_surrogate()
+                self._sbuf.append(_ESCAPES.get(ch, ch))
+                self._str_grew = True
+                self._state = _IN_STRING
+            return False
+
+        if state == _IN_UNICODE:
+            self._ubuf += ch
+            if len(self._ubuf) == 4:
+                try:
+                    code = int(self._ubuf, 16)
+                except ValueError as exc:
+                    raise ValueError(f"bad unicode escape: {self._ubuf!r}") from exc
+                self._end_unicode(code)
+                self._state = _IN_STRING
+            return False
+
+        if state == _IN_NUMLIT:
+            if ch in _NUMLIT_CHARS:
+                self._nbuf.append(ch)
+                return False
+            # 구분자 도달: 숫자/리터럴 확정 후 같은 문자를 재처리
+            dirty = self._end_numlit()
+            return self._consume(ch) or dirty
+
+        if ch in _WHITESPACE:
+            return False
+
+        if state == _EXPECT_VALUE:
+            return self._begin_value(ch)
+
+        if state == _AFTER_VALUE:
+            if ch == ",":
+                container = self._stack[-1][0] if self._stack else None
+                self._state = _EXPECT_KEY if isinstance(container, dict) \
+                    else _EXPECT_VALUE
+                return False
+            if ch == "}" or ch == "]":
+                return self._close_container(ch)
+            raise ValueError(f"unexpected character {ch!r} after value")
+
+        if state == _EXPECT_KEY:
+            if ch == '"':
+                self._state = _IN_STRING
+                self._is_key = True
+                self._sbuf = []
+                return False
+            if ch == "}":
+                return self._close_container(ch)
+            raise ValueError(f"unexpected character {ch!r}, expected object key")
+
+        if state == _EXPECT_COLON:
+            if ch == ":":
+                self._state = _EXPECT_VALUE
+                return False
+            raise ValueError(f"unexpected character {ch!r}, expected ':'")
+
+        raise ValueError(f"unexpected character {ch!r}")  # pragma: no cover
+
+    def _begin_value(self, ch: str) -> bool:
+        if ch == "{":
+            container: Dict[str, Any] = {}
+            dirty = False
+            if not self._started:
+                self._started = True
+                container = self.args
+            else:
+                # 중첩 컨테이너는 배치 즉시 args에서 관찰 가능하므로 dirty
+                # (빈 객체/배열이 유일한 변화인 청크도 True를 반환해야 함)
+                self._place(container, final=True)
+                dirty = True
+            self._stack.append((container, None))
+            self._state = _EXPECT_KEY
+            return dirty
+        if not self._started:
+            raise ValueError(f"tool args must be a JSON object, got {ch!r}")
+        if ch == "[":
+            arr: List[Any] = []
+            self._place(arr, final=True)
+            self._stack.append((arr, None))
+            self._state = _EXPECT_VALUE
+            return True
+        if ch == '"':
+            self._state = _IN_STRING
+            self._is_key = False
+            self._sbuf = []
+            self._placed = False
+            return False
+        if ch == "]" and self._stack and isinstance(self._stack[-1][0], list):
+            return self._close_container(ch)
+        if ch in _NUMLIT_CHARS:
+            self._state = _IN_NUMLIT
+            self._nbuf = [ch]
+            return False
+        raise ValueError(f"unexpected character {ch!r}, expected value")
+
+    def _end_unicode(self, code: int) -> None:
+        """
+        \\uXXXX 하나를 디코딩해 문자열 버퍼에 반영합니다.
+
+        LLM 제공자는 BMP 밖 문자(이모지 등)를 UTF-16 서로게이트 쌍
+        (예: 🎉 → "\\ud83c\\udf89")으로 스트리밍하므로, 하이 서로게이트는
+        바로 문자로 만들지 않고 다음 \\uXXXX가 로우 서로게이트인지 확인해
+        하나의 코드 포인트로 결합합니다. 짝을 이루지 못한 절반은 U+FFFD로
+        대체해, 인코딩 불가능한 외톨이 서로게이트가 args에 남지 않게 합니다.
+        """
+        if self._pending_hi is not None:
+            if 0xDC00 <= code <= 0xDFFF:
+                combined = 0x10000 \
+                    + ((self._pending_hi - 0xD800) << 10) + (code - 0xDC00)
+                self._pending_hi = None
+                self._sbuf.append(chr(combined))
+                self._str_grew = True
+                return
+            self._flush_lone_surrogate()
+        if 0xD800 <= code <= 0xDBFF:
+            self._pending_hi = code
+            return
+        if 0xDC00 <= code <= 0xDFFF:
+            code = 0xFFFD
+        self._sbuf.append(chr(code))
+        self._str_grew = True
+
+    def _flush_lone_surrogate(self) -> None:
+        """짝 없는 하이 서로게이트를 U+FFFD로 확정합니다."""
+        self._pending_hi = None
+        self._sbuf.append("�")
+        self._str_grew = True
+
+    def _end_string(self) -> bool:
+        text = "".join(self._sbuf)
+        if self._is_key:
+            self._is_key = False
+            container = self._stack[-1][0]
+            self._stack[-1] = (container, text)
+            self._state = _EXPECT_COLON
+            return False
+        self._place(text, final=True)
+        self._state = _AFTER_VALUE
+        return True
+
+    def _end_numlit(self) -> bool:
+        text = "".join(self._nbuf)
+        self._nbuf = []
+        if text in _LITERALS:
+            value: Any = _LITERALS[text]
+        else:
+            try:
+                value = int(text)
+            except ValueError:
+                try:
+                    value = float(text)
+                except ValueError as exc:
+                    raise ValueError(f"bad literal {text!r}") from exc
+        self._place(value, final=True)
+        self._state = _AFTER_VALUE
+        return True
+
+    def _close_container(self, ch: str) -> bool:
+        if not self._stack:
+            raise ValueError(f"unbalanced {ch!r}")
+        container = self._stack.pop()[0]
+        expected = dict if ch == "}" else list
+        if not isinstance(container, expected):
+            raise ValueError(f"mismatched closing {ch!r}")
+        self._state = _AFTER_VALUE
+        return False
+
+    def _place(self, value: Any, *, final: bool) -> None:
+        """현재 프레임의 대기 슬롯에 값을 기록합니다 (부분 값은 덮어쓰기)."""
+        if not self._stack:
+            return
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            if key is not None:
+                container[key] = value
+        else:
+            if self._placed:
+                container[-1] = value
+            else:
+                container.append(value)
+        self._placed = not final
@@ -0,0 +1,61 @@
+"""
+CopilotKit 내부 JSON 인코더 선택 모듈
+
+설치된 패키지 중 가장 빠른 JSON 인코더를 임포트 시점에 한 번 선택하여
+`dumps(obj, default=None) -> bytes`로 노출합니다. 우선순위는
+orjson(Rust/SIMD) → ujson(C) → stdlib json이며, 어느 경로든 시그니처와
+default 훅 동작은 동일합니다. 네이티브 휠이 없는 플랫폼(musllinux 등)
+에서도 설치 실패 없이 동작하도록 어떤 인코더도 필수 의존성으로
+선언하지 않습니다.
+
+Attributes
+----------
+BACKEND : str
+    선택된 인코더 이름 ("orjson" | "ujson" | "json")
+dumps : Callable[..., bytes]
+    JSON bytes 인코더 (키워드 인자 default 지원)
+"""
+
+from typing import Any
+
+try:
+    import orjson as _backend
+
+    dumps = _backend.dumps
+    BACKEND = "orjson"
+except ImportError:  # pragma: no cover
+    try:
+        import ujson as _backend
+
+        def dumps(obj: Any, default: Any = None) -> bytes:
+            """ujson 기반 bytes 인코더 (orjson과 동일한 시그니처)."""
+            # ensure_ascii=False: orjson과 동일하게 비ASCII 문자를
+            # \uXXXX 이스케이프(최대 6배 팽창) 없이 UTF-8 그대로 내보냄
+            return _backend.dumps(
+                obj, default=default, ensure_ascii=False
+            ).encode("utf-8")
+
+        BACKEND = "ujson"
+    except ImportError:
+        import json as _backend
+
+        # json.dumps는 호출마다 JSONEncoder 인스턴스를 새로 만든다.
+        # default 훅별로 구성 완료된 인코더를 캐시해 재사용하면 호출당
+        # 할당이 사라진다. check_circular=False는 평탄한 이벤트 구조에서
+        # 안전하며 재귀 추적 비용을 없애고, separators=(",", ":")는
+        # orjson과 동일한 압축 출력으로 키-값 쌍마다 2바이트를 줄인다.
+        _ENCODERS: dict = {}
+
+        def dumps(obj: Any, default: Any = None) -> bytes:
+            """stdlib json 기반 bytes 인코더 (orjson과 동일한 시그니처)."""
+            encode = _ENCODERS.get(default)
+            if encode is None:
+                encode = _ENCODERS[default] = _backend.JSONEncoder(
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                    check_circular=False,
+                    default=default,
+                ).encode
+            return encode(obj).encode("utf-8")
+
+        BACKEND = "json"
@@ -280,12 +280,12 @@ class CrewAIAgent(Agent):
             agent_state_message(
                 thread_id=thread_id,
                 agent_name=self.name,
-                node_name=execution["node_name"],
+                node_name=execution.node_name,
                 run_id=run_id,
                 active=False,
                 role="assistant",
                 state=json.dumps(filter_state(state, exclude_keys=["id"])),
-                running=not execution["should_exit"]
+                running=not execution.should_exit
             )
         )
     
@@ -69,24 +69,24 @@ async def crewai_flow_async_runner(flow: Flow, inputs: Dict[str, Any]):
             await queue_put(RunStarted(
                 type=RuntimeEventTypes.RUN_STARTED,
                 state=flow.state
-            ), priority=True)
+            ))
         elif isinstance(event, MethodExecutionStartedEvent):
             await queue_put(NodeStarted(
                 type=RuntimeEventTypes.NODE_STARTED,
                 node_name=event.method_name,
                 state=flow.state
-            ), priority=True)
+            ))
         elif isinstance(event, MethodExecutionFinishedEvent):
             await queue_put(NodeFinished(
                 type=RuntimeEventTypes.NODE_FINISHED,
                 node_name=event.method_name,
                 state=flow.state
-            ), priority=True)
+            ))
         elif isinstance(event, FlowFinishedEvent):
             await queue_put(RunFinished(
                 type=RuntimeEventTypes.RUN_FINISHED,
                 state=flow.state
-            ), priority=True)
+            ))
 
     
     def _global_event_listener(_sender: Any, _event: CrewAIFlowEvent, **_kw):  # noqa: D401
@@ -147,10 +147,10 @@ async def copilotkit_emit_state(state: Any) -> Literal[True]:
 
     await queue_put(
         agent_state_message(
-            thread_id=execution["thread_id"],
-            agent_name=execution["agent_name"],
-            node_name=execution["node_name"],
-            run_id=execution["run_id"],
+            thread_id=execution.thread_id,
+            agent_name=execution.agent_name,
+            node_name=execution.node_name,
+            run_id=execution.run_id,
             active=True,
             role="assistant",
             state=json.dumps(state_as_dict),
@@ -130,7 +130,7 @@ graph LR
 """
 
 import json
-from typing import Dict, Any, List, Optional, Union, AsyncGenerator
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union, AsyncGenerator
 from enum import Enum
 from ag_ui_langgraph import LangGraphAgent
 from ag_ui.core import (
@@ -147,10 +147,10 @@ from ag_ui.core import (
 from langgraph.graph.state import CompiledStateGraph
 from langchain_core.runnables import RunnableConfig
 
-try:
-    from langchain.schema import BaseMessage
-except ImportError:
-    # Langchain >= 1.0.0
+if TYPE_CHECKING:
+    # 타입 체크 전용 임포트: langchain.schema/langchain_core.messages는 서브트리가 커서
+    # 런타임에 임포트하면 SDK 콜드 스타트가 느려집니다. 이 메서드에서 BaseMessage는
+    # isinstance 검사 없이 타입 힌트로만 사용되므로 TYPE_CHECKING 가드로 충분합니다.
     from langchain_core.messages import BaseMessage
 
 
@@ -215,6 +215,32 @@ class PredictStateTool:
         self.tool_argument = tool_argument
 
 
+# 핫 패스에서 매 이벤트마다 enum .value 접근을 피하기 위한 모듈 레벨 상수
+_ON_CHAT_MODEL_STREAM = LangGraphEventTypes.OnChatModelStream.value
+
+# 필터링된 이벤트를 나타내는 공유 센티널 (인터닝된 빈 문자열)
+# 호출자는 is_filtered()의 identity 비교로 바이트 단위 == 비교 없이
+# 필터링 여부를 판별하고, 필터링된 이벤트의 전송을 건너뛸 수 있습니다.
+_FILTERED_OUT = ""
+
+
+def is_filtered(result: str) -> bool:
+    """
+    _dispatch_event의 반환값이 필터링된 이벤트인지 판별합니다.
+
+    Parameters
+    ----------
+    result : str
+        _dispatch_event가 반환한 직렬화된 이벤트 문자열
+
+    Returns
+    -------
+    bool
+        필터링 센티널이면 True (identity 비교)
+    """
+    return result is _FILTERED_OUT
+
+
 # 타입 별칭 정의
 State = Dict[str, Any]
 """에이전트 상태 타입"""
@@ -313,6 +339,9 @@ class LangGraphAGUIAgent(LangGraphAgent):
         - copilotkit:emit-tool-calls: false면 도구 호출 이벤트 스킵
         - copilotkit:emit-messages: false면 메시지 이벤트 스킵
         """
+        # 부모 클래스 디스패처를 한 번만 바인딩 (매 호출마다 super() MRO 탐색 방지)
+        _super_dispatch = super()._dispatch_event
+
         # CustomEvent 타입인 경우 CopilotKit 전용 처리
         if event.type == EventType.CUSTOM:
             custom_event = event
@@ -320,7 +349,7 @@ class LangGraphAGUIAgent(LangGraphAgent):
             # 수동 메시지 방출: 시작-내용-종료 3개 이벤트로 분리
             if custom_event.name == CustomEventNames.ManuallyEmitMessage.value:
                 # 메시지 시작 이벤트
-                super()._dispatch_event(
+                _super_dispatch(
                     TextMessageStartEvent(
                         type=EventType.TEXT_MESSAGE_START,
                         role="assistant",
@@ -329,7 +358,7 @@ class LangGraphAGUIAgent(LangGraphAgent):
                     )
                 )
                 # 메시지 내용 이벤트
-                super()._dispatch_event(
+                _super_dispatch(
                     TextMessageContentEvent(
                         type=EventType.TEXT_MESSAGE_CONTENT,
                         message_id=custom_event.value["message_id"],
@@ -338,19 +367,19 @@ class LangGraphAGUIAgent(LangGraphAgent):
                     )
                 )
                 # 메시지 종료 이벤트
-                super()._dispatch_event(
+                _super_dispatch(
                     TextMessageEndEvent(
                         type=EventType.TEXT_MESSAGE_END,
                         message_id=custom_event.value["message_id"],
                         raw_event=event,
                     )
                 )
-                return super()._dispatch_event(event)
+                return _super_dispatch(event)
 
             # 수동 도구 호출 방출: 시작-인자-종료 3개 이벤트로 분리
             if custom_event.name == CustomEventNames.ManuallyEmitToolCall.value:
                 # 도구 호출 시작 이벤트
-                super()._dispatch_event(
+                _super_dispatch(
                     ToolCallStartEvent(
                         type=EventType.TOOL_CALL_START,
                         tool_call_id=custom_event.value["id"],
@@ -360,7 +389,7 @@ class LangGraphAGUIAgent(LangGraphAgent):
                     )
                 )
                 # 도구 호출 인자 이벤트
-                super()._dispatch_event(
+                _super_dispatch(
                     ToolCallArgsEvent(
                         type=EventType.TOOL_CALL_ARGS,
                         tool_call_id=custom_event.value["id"],
@@ -370,30 +399,32 @@ class LangGraphAGUIAgent(LangGraphAgent):
                     )
                 )
                 # 도구 호출 종료 이벤트
-                super()._dispatch_event(
+                _super_dispatch(
                     ToolCallEndEvent(
                         type=EventType.TOOL_CALL_END,
                         tool_call_id=custom_event.value["id"],
                         raw_event=event,
                     )
                 )
-                return super()._dispatch_event(event)
+                return _super_dispatch(event)
 
             # 수동 상태 방출: 상태 스냅샷 이벤트로 변환
             if custom_event.name == CustomEventNames.ManuallyEmitState.value:
                 # 현재 실행 중인 run의 수동 방출 상태 저장
-                self.active_run["manually_emitted_state"] = custom_event.value
-                return super()._dispatch_event(
+                # 저장 직후 다시 조회하지 않고 로컬 참조를 그대로 스냅샷에 사용
+                state_val = custom_event.value
+                self.active_run["manually_emitted_state"] = state_val
+                return _super_dispatch(
                     StateSnapshotEvent(
                         type=EventType.STATE_SNAPSHOT,
-                        snapshot=self.get_state_snapshot(self.active_run["manually_emitted_state"]),
+                        snapshot=self.get_state_snapshot(state_val),
                         raw_event=event,
                     )
                 )
 
             # 종료 이벤트: Exit 커스텀 이벤트로 변환
             if custom_event.name == "copilotkit_exit":
-                return super()._dispatch_event(
+                return _super_dispatch(
                     CustomEvent(
                         type=EventType.CUSTOM,
                         name="Exit",
@@ -424,15 +455,15 @@ class LangGraphAGUIAgent(LangGraphAgent):
             # 도구 호출 방출 필터
             if "copilotkit:emit-tool-calls" in metadata:
                 if metadata["copilotkit:emit-tool-calls"] is False and is_tool_event:
-                    return ""  # 이벤트 스킵
+                    return _FILTERED_OUT  # 이벤트 스킵
 
             # 메시지 방출 필터
             if "copilotkit:emit-messages" in metadata:
                 if metadata["copilotkit:emit-messages"] is False and is_message_event:
-                    return ""  # 이벤트 스킵
+                    return _FILTERED_OUT  # 이벤트 스킵
 
         # 필터링되지 않은 이벤트는 부모 클래스의 디스패처로 전달
-        return super()._dispatch_event(event)
+        return _super_dispatch(event)
 
     async def _handle_single_event(self, event: Any, state: State) -> AsyncGenerator[str, None]:
         """
@@ -464,17 +495,20 @@ class LangGraphAGUIAgent(LangGraphAgent):
         4. 실시간으로 상태 동기화 이벤트 방출
         """
         # on_chat_model_stream 이벤트에 PredictState 메타데이터 추가
-        if event.get("event") == LangGraphEventTypes.OnChatModelStream.value:
-            # 메타데이터에서 중간 상태 방출 설정 가져오기
-            predict_state_metadata = event.get("metadata", {}).get("copilotkit:emit-intermediate-state", [])
-            # predict_state 필드로 메타데이터 복사
-            event["metadata"]['predict_state'] = predict_state_metadata
+        # (그 외 이벤트는 비교 한 번만 수행하고 바로 부모 클래스로 위임)
+        if event.get("event") == _ON_CHAT_MODEL_STREAM:
+            # 메타데이터에서 중간 상태 방출 설정 가져와 predict_state 필드로 복사
+            # 메타데이터가 없으면 빈 딕셔너리를 만들지 않고 건너뜀
+            metadata = event.get("metadata")
+            if metadata is not None:
+                metadata['predict_state'] = metadata.get("copilotkit:emit-intermediate-state", [])
 
         # 부모 클래스의 이벤트 처리 메서드 호출 (제너레이터)
-        async for event_str in super()._handle_single_event(event, state):
+        _super_handle = super()._handle_single_event(event, state)
+        async for event_str in _super_handle:
             yield event_str
 
-    def langgraph_default_merge_state(self, state: State, messages: List[BaseMessage], input: Any) -> State:
+    def langgraph_default_merge_state(self, state: State, messages: "List[BaseMessage]", input: Any) -> State:
         """
         기본 상태 병합 로직을 오버라이드하여 CopilotKit 액션을 추가합니다.
 
@@ -505,6 +539,10 @@ class LangGraphAGUIAgent(LangGraphAgent):
         2. ag-ui 필드에서 tools와 context 추출
         3. copilotkit 필드에 actions로 변환하여 저장
         4. 원본 상태와 병합하여 반환
+
+        부모 클래스가 이미 새 딕셔너리를 반환하므로, 전체 상태를 다시 복사하지 않고
+        copilotkit 키만 제자리에서 추가한 뒤 반환합니다 (dict.setdefault와 같은
+        mutate-then-return 패턴). 메시지 히스토리가 큰 상태에서 O(n) 복사를 피합니다.
         """
         # 부모 클래스의 기본 병합 로직 실행
         merged_state = super().langgraph_default_merge_state(state, messages, input)
@@ -512,11 +550,9 @@ class LangGraphAGUIAgent(LangGraphAgent):
         # AG-UI 속성 추출 (ag-ui 필드가 있으면 사용, 없으면 전체 상태 사용)
         agui_properties = merged_state.get('ag-ui', {}) or merged_state
 
-        # CopilotKit 형식으로 변환
-        return {
-            **merged_state,
-            'copilotkit': {
-                'actions': agui_properties.get('tools', []),      # AG-UI tools → CopilotKit actions
-                'context': agui_properties.get('context', [])     # AG-UI context 유지
-            },
+        # CopilotKit 형식으로 변환 (in-place 추가 후 반환)
+        merged_state['copilotkit'] = {
+            'actions': agui_properties.get('tools', []),      # AG-UI tools → CopilotKit actions
+            'context': agui_properties.get('context', [])     # AG-UI context 유지
         }
+        return merged_state
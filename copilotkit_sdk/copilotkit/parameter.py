@@ -284,6 +284,14 @@ Common Pitfalls
   }
   ```
 
+Performance Notes
+-----------------
+
+이 모듈은 mypyc/Cython 등 AOT 컴파일러로 빌드해도 동작이 달라지지
+않도록 유지됩니다: 런타임 몽키패칭 없음, 모듈 레벨 상수/레지스트리만
+사용, 공개 API는 일반 함수와 slots 데이터클래스. 컴파일 빌드를
+도입하려면 wheel 빌드 단계에서 이 파일만 대상으로 지정하면 됩니다.
+
 See Also
 --------
 
@@ -291,9 +299,26 @@ See Also
 - copilotkit.action.ActionDict : 액션 스키마 정의
 """
 
-from typing import TypedDict, Optional, Literal, List, Union, cast, Any
+import asyncio
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import TypedDict, Optional, Literal, List, Union, Dict, Any
 from typing_extensions import NotRequired
 
+try:
+    # 선택적 가속: orjson이 설치되어 있으면 C 구현 인코더로 스키마를 직렬화
+    # (필수 의존성은 아니며, 없으면 stdlib json으로 동작)
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+
+def _encode_schema(obj: Any) -> bytes:
+    """파라미터 스키마를 JSON bytes로 인코딩합니다 (orjson 사용 가능 시 가속)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 class SimpleParameter(TypedDict):
     """
     기본 타입 파라미터
@@ -498,6 +523,47 @@ Examples
 ... ]
 """
 
+# attributes 재귀 정규화가 필요한 타입 태그
+# 두 번의 문자열 == 비교 대신 해시 기반 단일 멤버십 검사를 사용
+_OBJECT_TYPES: frozenset = frozenset(("object", "object[]"))
+
+# 정규화 기본값 상수
+# 모듈 레벨 상수에 바인딩하면 매 호출마다 새 문자열 객체를 만들거나
+# 리터럴을 다시 로드하지 않고 항상 같은 (인터닝된) 객체를 재사용합니다.
+_STRING = sys.intern('string')
+_EMPTY = ''
+
+# 파라미터별 사전 계산된 enum frozenset 레지스트리
+# 키: id(parameter), 값: (파라미터 참조 핀, frozenset(enum))
+# 다운스트림 검증기가 O(|enum|) 선형 탐색 대신 O(1) 멤버십 검사를 하도록
+# 등록(정규화) 시점에 한 번만 계산합니다.
+_ENUM_SETS: Dict[int, Any] = {}
+
+# 정규화 완료된 리스트의 레지스트리
+# 키: 입력 리스트의 id(), 값: 해당 리스트 참조 (id 재사용 오탐 방지용 핀)
+# 액션 스키마는 대부분 정적 리스트가 요청마다 재직렬화되므로,
+# 동일한 리스트 객체가 다시 들어오면 전체 트리 순회를 건너뜁니다.
+_NORMALIZE_CACHE: Dict[int, Any] = {}
+
+# 이미 정규화된 개별 파라미터 딕셔너리의 레지스트리
+# 키: id(parameter), 값: 해당 딕셔너리 참조 (id 재사용 오탐 방지용 핀)
+# 직렬화될 딕셔너리 자체에 마커 키를 추가하면 클라이언트로 전송되는
+# 스키마에 노출되므로, 외부 레지스트리로 정규화 여부를 추적합니다.
+_NORMALIZED_PARAMS: Dict[int, Any] = {}
+
+# id() 키 레지스트리 공통 상한
+# 레지스트리 항목은 (참조 핀, 값) 형태로 파라미터 트리를 강하게 고정하므로,
+# 요청마다 build_actions()로 새 스키마를 만드는 배포에서는 항목이 영원히
+# 쌓입니다. 상한에 도달하면 레지스트리를 통째로 비웁니다 — 캐시 미스는
+# 재계산 비용만 낼 뿐 정확성에는 영향이 없고, 정적 스키마는 다음 조회에서
+# 즉시 다시 등록됩니다.
+_REGISTRY_LIMIT = 4096
+
+def _evict_if_full(registry: Dict[int, Any]) -> None:
+    """상한에 도달한 레지스트리를 비워 무한 성장을 막습니다."""
+    if len(registry) >= _REGISTRY_LIMIT:
+        registry.clear()
+
 def normalize_parameters(parameters: Optional[List[Parameter]]) -> List[Parameter]:
     """
     파라미터 리스트를 정규화합니다.
@@ -542,13 +608,64 @@ def normalize_parameters(parameters: Optional[List[Parameter]]) -> List[Paramete
     >>> print(normalized[0]["attributes"])
     [{"name": "city", "type": "string", "required": True, "description": ""}]
 
+    Notes
+    -----
+    - 정규화는 in-place로 수행되며 입력 리스트가 그대로 반환됩니다
+      (새 리스트 할당 없음; 각 파라미터도 제자리에서 수정됨)
+    - 동일한 리스트 객체가 반복 전달되면 (정적 액션 스키마의 재직렬화 등)
+      id() 기반 레지스트리에서 순회 없이 바로 반환합니다
+
     See Also
     --------
     _normalize_parameter : 단일 파라미터 정규화 (내부 함수)
     """
     if parameters is None:
         return []
-    return [_normalize_parameter(parameter) for parameter in parameters]
+
+    if _NORMALIZE_CACHE.get(id(parameters)) is parameters:
+        return parameters
+
+    # 재귀 대신 명시적 스택으로 순회: 중첩 object/object[] 트리에서
+    # 노드마다 Python 프레임을 생성하는 비용을 제거
+    # visited는 공유/순환 attributes 리스트의 중복 적재를 막음
+    # (DAG 형태로 attributes를 공유하는 스키마에서 같은 서브트리를
+    #  여러 번 순회하거나 순환 참조로 무한 루프에 빠지는 것을 방지)
+    visited = {id(parameters)}
+    stack = [parameters]
+    while stack:
+        for parameter in stack.pop():
+            # 이미 정규화된 파라미터는 건너뜀
+            if _NORMALIZED_PARAMS.get(id(parameter)) is parameter:
+                continue
+
+            # 기본값 채우기 (setdefault로 멤버십 검사와 할당을 한 번에)
+            parameter.setdefault('type', _STRING)  # type: ignore[typeddict-item]
+            parameter.setdefault('required', True)
+            parameter.setdefault('description', _EMPTY)
+
+            # 객체 타입이면 attributes 리스트를 작업 스택에 적재
+            # (이미 리스트가 있으면 재할당 없이 그대로 사용 — 단일 probe)
+            if parameter['type'] in _OBJECT_TYPES:
+                attributes = parameter.get('attributes')
+                if attributes is None:
+                    parameter['attributes'] = []  # type: ignore[typeddict-unknown-key]
+                elif id(attributes) not in visited:
+                    visited.add(id(attributes))
+                    stack.append(attributes)
+
+            # enum이 있으면 등록 시점에 frozenset을 미리 계산
+            # (딕셔너리에 넣으면 직렬화에 노출되므로 레지스트리에 보관)
+            enum_values = parameter.get('enum')  # type: ignore[typeddict-item]
+            if isinstance(enum_values, list):
+                _evict_if_full(_ENUM_SETS)
+                _ENUM_SETS[id(parameter)] = (parameter, frozenset(enum_values))
+
+            _evict_if_full(_NORMALIZED_PARAMS)
+            _NORMALIZED_PARAMS[id(parameter)] = parameter
+
+    _evict_if_full(_NORMALIZE_CACHE)
+    _NORMALIZE_CACHE[id(parameters)] = parameters
+    return parameters
 
 def _normalize_parameter(parameter: Parameter) -> Parameter:
     """
@@ -600,20 +717,478 @@ def _normalize_parameter(parameter: Parameter) -> Parameter:
         ]
     }
     """
-    # type 필드 기본값: "string"
-    if not "type" in parameter:
-        cast(Any, parameter)['type'] = 'string'
-
-    # required 필드 기본값: True
-    if not 'required' in parameter:
-        parameter['required'] = True
+    # 이미 정규화된 파라미터면 멤버십 검사/재귀 없이 즉시 반환
+    # (직렬화 대상 딕셔너리에 마커 키를 넣는 대신 모듈 레벨 id 레지스트리 사용)
+    if _NORMALIZED_PARAMS.get(id(parameter)) is parameter:
+        return parameter
 
-    # description 필드 기본값: ""
-    if not 'description' in parameter:
-        parameter['description'] = ''
+    # 기본값 채우기: setdefault로 멤버십 검사와 할당을 한 번의 해시 조회로 처리
+    parameter.setdefault('type', _STRING)  # type: ignore[typeddict-item]  # type 기본값: "string"
+    parameter.setdefault('required', True)                 # required 기본값: True
+    parameter.setdefault('description', _EMPTY)            # description 기본값: ""
 
     # 객체 타입인 경우 attributes도 재귀적으로 정규화
-    if 'type' in parameter and (parameter['type'] == 'object' or parameter['type'] == 'object[]'):
-        cast(Any, parameter)['attributes'] = normalize_parameters(parameter.get('attributes'))
-
+    # (setdefault 이후 type은 항상 존재; 리스트가 이미 있으면
+    #  None → [] 왕복과 재할당 없이 제자리 정규화만 수행)
+    if parameter['type'] in _OBJECT_TYPES:
+        attributes = parameter.get('attributes')
+        if attributes is None:
+            parameter['attributes'] = []  # type: ignore[typeddict-unknown-key]
+        else:
+            normalize_parameters(attributes)
+
+    _evict_if_full(_NORMALIZED_PARAMS)
+    _NORMALIZED_PARAMS[id(parameter)] = parameter
     return parameter
+
+# 파라미터 리스트별 사전 직렬화된 JSON bytes 캐시
+# 키: id(parameters), 값: (리스트 참조 핀, 직렬화된 bytes)
+_COMPILED_SCHEMA: Dict[int, Any] = {}
+
+def compiled_parameters(parameters: Optional[List[Parameter]]) -> bytes:
+    """
+    정규화된 파라미터 스키마를 사전 직렬화된 JSON bytes로 반환합니다.
+
+    정적 액션 스키마는 매 LLM 호출마다 dict → JSON 변환을 반복하게 되는데,
+    이 함수는 첫 호출 시 한 번만 직렬화하고 이후에는 캐시된 bytes를
+    그대로 반환합니다. 다운스트림 직렬화기는 dict를 다시 인코딩하는 대신
+    이 blob을 바로 전송할 수 있습니다.
+
+    Parameters
+    ----------
+    parameters : Optional[List[Parameter]]
+        직렬화할 파라미터 리스트 (정규화되지 않았으면 먼저 정규화됨)
+
+    Returns
+    -------
+    bytes
+        UTF-8로 인코딩된 JSON 배열 bytes
+
+    Examples
+    --------
+    >>> params = [{"name": "query", "type": "string"}]
+    >>> blob = compiled_parameters(params)
+    >>> compiled_parameters(params) is blob  # 두 번째 호출은 캐시 히트
+    True
+
+    See Also
+    --------
+    normalize_parameters : 파라미터 정규화
+    """
+    if parameters is None:
+        return b"[]"
+
+    cached = _COMPILED_SCHEMA.get(id(parameters))
+    if cached is not None and cached[0] is parameters:
+        return cached[1]
+
+    blob = _encode_schema(normalize_parameters(parameters))
+    _evict_if_full(_COMPILED_SCHEMA)
+    _COMPILED_SCHEMA[id(parameters)] = (parameters, blob)
+    return blob
+
+@dataclass(slots=True)
+class ParameterTable:
+    """
+    파라미터 리스트의 SoA(Struct-of-Arrays) 표현
+
+    파라미터 하나당 딕셔너리 하나를 유지하는 대신, 필드별 병렬 리스트로
+    평탄화하여 대량 검증/순회 루프를 캐시 친화적으로 만듭니다.
+    중첩된 object/object[] 구조는 자식 행 인덱스 리스트로 표현합니다.
+
+    Attributes
+    ----------
+    names : List[str]
+        각 행의 파라미터 이름
+    types : List[str]
+        각 행의 타입 태그
+    required : List[bool]
+        각 행의 필수 여부
+    descriptions : List[str]
+        각 행의 설명
+    enums : List[Optional[List[str]]]
+        각 행의 enum 값 목록 (없으면 None)
+    children : List[Optional[List[int]]]
+        object/object[] 행의 자식 행 인덱스 목록 (그 외 None)
+    roots : List[int]
+        최상위 파라미터에 해당하는 행 인덱스
+
+    Examples
+    --------
+    >>> table = ParameterTable.from_parameters([
+    ...     {"name": "query"},
+    ...     {"name": "user", "type": "object",
+    ...      "attributes": [{"name": "city"}]}
+    ... ])
+    >>> table.names
+    ['query', 'user', 'city']
+    >>> table.children[1]
+    [2]
+    >>> table.to_parameters()[0]["type"]
+    'string'
+
+    See Also
+    --------
+    normalize_parameters : 딕셔너리 기반 정규화 (기본 경로)
+    """
+    names: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    required: List[bool] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    enums: List[Optional[List[str]]] = field(default_factory=list)
+    children: List[Optional[List[int]]] = field(default_factory=list)
+    roots: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_parameters(cls, parameters: Optional[List[Parameter]]) -> "ParameterTable":
+        """
+        파라미터 리스트를 정규화하며 SoA 테이블로 평탄화합니다.
+
+        Parameters
+        ----------
+        parameters : Optional[List[Parameter]]
+            변환할 파라미터 리스트 (정규화되지 않았으면 먼저 정규화됨)
+
+        Returns
+        -------
+        ParameterTable
+            평탄화된 테이블
+        """
+        table = cls()
+        if parameters is None:
+            return table
+        table.roots = table._append_rows(normalize_parameters(parameters))
+        return table
+
+    def _append_rows(self, parameters: List[Parameter]) -> List[int]:
+        """파라미터 리스트를 행으로 추가하고 행 인덱스 목록을 반환합니다."""
+        # 길이를 미리 알고 있으므로 인덱스 리스트를 사전 할당
+        # (빈 리스트에서 append로 키우며 발생하는 재할당 제거)
+        indices = [0] * len(parameters)
+        for slot, parameter in enumerate(parameters):
+            index = len(self.names)
+            indices[slot] = index
+            self.names.append(parameter["name"])
+            self.types.append(parameter["type"])  # type: ignore[typeddict-item]
+            self.required.append(parameter["required"])  # type: ignore[typeddict-item]
+            self.descriptions.append(parameter["description"])  # type: ignore[typeddict-item]
+            self.enums.append(parameter.get("enum"))  # type: ignore[typeddict-item]
+            # 자식 행은 재귀적으로 추가 (행 추가 후 children 슬롯 채움)
+            self.children.append(None)
+            if parameter["type"] in _OBJECT_TYPES:  # type: ignore[typeddict-item]
+                self.children[index] = self._append_rows(
+                    parameter.get("attributes") or []  # type: ignore[typeddict-item]
+                )
+        return indices
+
+    def to_parameters(self) -> List[Parameter]:
+        """
+        테이블을 딕셔너리 기반 파라미터 리스트로 복원합니다 (하위 호환용 뷰).
+
+        Returns
+        -------
+        List[Parameter]
+            정규화된 형태의 파라미터 리스트
+        """
+        return [self._row_to_parameter(index) for index in self.roots]
+
+    def _row_to_parameter(self, index: int) -> Parameter:
+        """단일 행을 파라미터 딕셔너리로 복원합니다."""
+        parameter: Dict[str, Any] = {
+            "name": self.names[index],
+            "type": self.types[index],
+            "required": self.required[index],
+            "description": self.descriptions[index],
+        }
+        if self.enums[index] is not None:
+            parameter["enum"] = self.enums[index]
+        child_indices = self.children[index]
+        if child_indices is not None:
+            parameter["attributes"] = [
+                self._row_to_parameter(child) for child in child_indices
+            ]
+        return cast_parameter(parameter)
+
+def cast_parameter(parameter: Dict[str, Any]) -> Parameter:
+    """딕셔너리를 Parameter 타입으로 취급합니다 (런타임 no-op)."""
+    return parameter  # type: ignore[return-value]
+
+def enum_set(parameter: Parameter) -> Optional[frozenset]:
+    """
+    파라미터의 enum 값을 frozenset으로 반환합니다.
+
+    정규화 시점에 미리 계산된 집합이 있으면 그대로 반환하고,
+    없으면 즉석에서 계산하여 레지스트리에 저장합니다.
+    인자 검증기는 `value in param['enum']` (선형 탐색) 대신
+    `value in enum_set(param)` (O(1) 해시 조회)을 사용할 수 있습니다.
+
+    Parameters
+    ----------
+    parameter : Parameter
+        조회할 파라미터
+
+    Returns
+    -------
+    Optional[frozenset]
+        enum이 정의된 경우 해당 값들의 frozenset, 없으면 None
+    """
+    cached = _ENUM_SETS.get(id(parameter))
+    if cached is not None and cached[0] is parameter:
+        return cached[1]
+
+    enum_values = parameter.get('enum')  # type: ignore[typeddict-item]
+    if not isinstance(enum_values, list):
+        return None
+
+    value_set = frozenset(enum_values)
+    _evict_if_full(_ENUM_SETS)
+    _ENUM_SETS[id(parameter)] = (parameter, value_set)
+    return value_set
+
+# 파라미터 타입 태그 → 런타임 isinstance 검사 대상 타입
+_TYPE_CHECKS: Dict[str, Any] = {
+    'string': str,
+    'number': (int, float),
+    'boolean': bool,
+    'object': dict,
+    'string[]': list,
+    'number[]': list,
+    'boolean[]': list,
+    'object[]': list,
+}
+
+# 파라미터 리스트별 컴파일된 검증 클로저 캐시
+# 키: id(parameters), 값: (리스트 참조 핀, 검증 함수)
+_VALIDATOR_CACHE: Dict[int, Any] = {}
+
+def _validate_passthrough(args: Dict[str, Any]) -> Dict[str, Any]:
+    """파라미터 없는 액션용 공유 통과 검증기 (호출마다 컴파일/캐시 불필요)"""
+    return args
+
+def build_validator(parameters: Optional[List[Parameter]]):
+    """
+    파라미터 스키마를 단일 검증 클로저로 컴파일합니다.
+
+    스키마를 매 호출마다 재해석하는 대신, 등록 시점에 한 번 순회하여
+    필수 여부/타입/enum 검사를 인라인 코드로 생성(exec/compile)합니다.
+    동일한 리스트 객체에 대해서는 컴파일된 함수를 캐시에서 재사용합니다.
+
+    Parameters
+    ----------
+    parameters : Optional[List[Parameter]]
+        컴파일할 파라미터 리스트 (정규화되지 않았으면 먼저 정규화됨)
+
+    Returns
+    -------
+    Callable[[Dict[str, Any]], Dict[str, Any]]
+        인자 딕셔너리를 받아 검증 후 그대로 반환하는 함수
+        검증 실패 시 ValueError 발생
+
+    Examples
+    --------
+    >>> params = [{"name": "query", "type": "string"}]
+    >>> validate = build_validator(params)
+    >>> validate({"query": "hello"})
+    {'query': 'hello'}
+    >>> validate({})
+    Traceback (most recent call last):
+        ...
+    ValueError: missing required argument 'query'
+
+    Notes
+    -----
+    - 검증 범위는 최상위 파라미터입니다. object/object[] 타입은
+      dict/list 여부까지만 확인하며, 중첩된 attributes 스키마는
+      검증하지 않습니다.
+    - 알 수 없는 type 태그(오타 등)는 타입 검사를 생략할 뿐
+      컴파일 오류를 일으키지 않습니다.
+    """
+    if parameters is None:
+        # 호출마다 새 리스트를 캐시에 고정하지 않도록 공유 함수를 반환
+        return _validate_passthrough
+
+    cached = _VALIDATOR_CACHE.get(id(parameters))
+    if cached is not None and cached[0] is parameters:
+        return cached[1]
+    normalize_parameters(parameters)
+
+    # 검증 코드를 한 줄씩 생성 (enum 집합과 타입 튜플은 클로저 환경으로 전달)
+    # 파라미터별 검사문을 먼저 모은 뒤 필요한 경우에만 가드를 출력합니다 —
+    # 알 수 없는 타입 태그처럼 검사가 하나도 없는 선택적 파라미터에서
+    # 본문 없는 if 블록(IndentationError)이 생기지 않게 하기 위함입니다.
+    lines = ["def _validate(args):"]
+    env: Dict[str, Any] = {}
+    for index, parameter in enumerate(parameters):
+        name = parameter['name']
+        check_type = _TYPE_CHECKS.get(parameter['type'])  # type: ignore[typeddict-item]
+        checks = []
+        if check_type is not None:
+            env[f"_t{index}"] = check_type
+            checks.append(
+                f"if not isinstance(args[{name!r}], _t{index}):"
+                f" raise ValueError(\"argument '\" {name!r} \"' has invalid type\")"
+            )
+        values = enum_set(parameter)
+        if values is not None:
+            env[f"_e{index}"] = values
+            checks.append(
+                f"if args[{name!r}] not in _e{index}:"
+                f" raise ValueError(\"argument '\" {name!r} \"' not in enum\")"
+            )
+        if parameter['required']:  # type: ignore[typeddict-item]
+            lines.append(
+                f"    if {name!r} not in args:"
+                f" raise ValueError(\"missing required argument '\" {name!r} \"'\")"
+            )
+            lines.extend("    " + check for check in checks)
+        elif checks:
+            lines.append(f"    if {name!r} in args:")
+            lines.extend("        " + check for check in checks)
+    lines.append("    return args")
+
+    exec(compile("\n".join(lines), "<copilotkit-parameter-validator>", "exec"), env)  # pylint: disable=exec-used
+    validator = env["_validate"]
+    _evict_if_full(_VALIDATOR_CACHE)
+    _VALIDATOR_CACHE[id(parameters)] = (parameters, validator)
+    return validator
+
+@dataclass(slots=True)
+class SimpleParam:
+    """
+    단일 파라미터의 슬롯 기반 표현
+
+    TypedDict(일반 딕셔너리) 파라미터는 항목당 해시 테이블 오버헤드를
+    지불하고 필드 접근마다 키 해시/탐색이 발생합니다. slots=True
+    데이터클래스는 필드를 고정 슬롯 오프셋에 저장하여 메모리를 줄이고
+    `p['type']` 대신 `p.type`의 C 레벨 속성 접근을 사용합니다.
+
+    직렬화 경계(JSON 스키마 전송)에서는 여전히 딕셔너리가 필요하므로
+    `from_dict` / `to_dict` 브리지로 양방향 변환합니다. 중첩된
+    object/object[] 파라미터의 attributes도 재귀적으로 변환됩니다.
+
+    Attributes
+    ----------
+    name : str
+        파라미터 이름
+    type : str
+        타입 태그 (기본값 "string")
+    required : bool
+        필수 여부 (기본값 True)
+    description : str
+        설명 (기본값 "")
+    enum : Optional[List[str]]
+        허용 값 목록 (string 타입 전용, 없으면 None)
+    attributes : Optional[List["SimpleParam"]]
+        중첩 파라미터 목록 (object/object[] 전용, 그 외 None)
+
+    Examples
+    --------
+    >>> param = SimpleParam.from_dict({"name": "query"})
+    >>> param.type
+    'string'
+    >>> param.to_dict()
+    {'name': 'query', 'type': 'string', 'required': True, 'description': ''}
+
+    See Also
+    --------
+    ParameterTable : 파라미터 리스트 전체의 SoA 표현
+    """
+    name: str
+    type: str = "string"
+    required: bool = True
+    description: str = ""
+    enum: Optional[List[str]] = None
+    attributes: Optional[List["SimpleParam"]] = None
+
+    @classmethod
+    def from_dict(cls, parameter: Dict[str, Any]) -> "SimpleParam":
+        """딕셔너리 형태의 파라미터를 슬롯 인스턴스로 변환합니다."""
+        attributes = parameter.get('attributes')
+        return cls(
+            name=parameter['name'],
+            type=parameter.get('type', 'string'),
+            required=parameter.get('required', True),
+            description=parameter.get('description', ''),
+            enum=parameter.get('enum'),
+            attributes=(
+                [cls.from_dict(attribute) for attribute in attributes]
+                if attributes is not None else None
+            ),
+        )
+
+    def to_dict(self) -> Parameter:
+        """슬롯 인스턴스를 정규화된 딕셔너리 파라미터로 되돌립니다."""
+        parameter: Dict[str, Any] = {
+            'name': self.name,
+            'type': self.type,
+            'required': self.required,
+            'description': self.description,
+        }
+        if self.enum is not None:
+            parameter['enum'] = self.enum
+        if self.attributes is not None:
+            parameter['attributes'] = [
+                attribute.to_dict() for attribute in self.attributes
+            ]
+        return parameter  # type: ignore[return-value]
+
+def slotted_parameters(parameters: Optional[List[Parameter]]) -> List[SimpleParam]:
+    """
+    파라미터 리스트를 슬롯 기반 표현으로 변환합니다.
+
+    정규화를 먼저 수행한 뒤 각 파라미터를 `SimpleParam`으로 감쌉니다.
+    딕셔너리 키 조회 대신 속성 접근으로 필드를 읽는 내부 핫 루프용이며,
+    직렬화 시에는 `to_dict`로 되돌립니다.
+
+    Parameters
+    ----------
+    parameters : Optional[List[Parameter]]
+        변환할 파라미터 리스트 (None이면 빈 리스트 반환)
+
+    Returns
+    -------
+    List[SimpleParam]
+        슬롯 기반 파라미터 리스트
+    """
+    if parameters is None:
+        return []
+    return [
+        SimpleParam.from_dict(parameter)
+        for parameter in normalize_parameters(parameters)
+    ]
+
+async def normalize_all_async(
+    groups: List[Optional[List[Parameter]]]
+) -> List[List[Parameter]]:
+    """
+    여러 액션의 파라미터 리스트를 병렬로 정규화합니다.
+
+    서버 기동 시 수십~수백 개의 액션을 등록하면 normalize_parameters가
+    이벤트 루프 스레드에서 순차 실행됩니다. 정규화는 액션별로 독립적인
+    순수 Python 작업이므로 asyncio.to_thread로 스레드 풀에 분산하면
+    기동 시간이 액션 수 대신 코어 수에 비례합니다.
+
+    Parameters
+    ----------
+    groups : List[Optional[List[Parameter]]]
+        액션별 파라미터 리스트 목록 (각 항목은 None 가능)
+
+    Returns
+    -------
+    List[List[Parameter]]
+        정규화된 파라미터 리스트 목록 (입력과 같은 순서)
+
+    Examples
+    --------
+    >>> # 서버 기동 시 일괄 정규화
+    >>> normalized = await normalize_all_async(
+    ...     [action.parameters for action in actions]
+    ... )
+
+    See Also
+    --------
+    normalize_parameters : 단일 파라미터 리스트 정규화
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(normalize_parameters, group) for group in groups)
+    )
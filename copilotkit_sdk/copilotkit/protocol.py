@@ -13,6 +13,9 @@ CopilotKit Runtime Protocol - 이벤트 타입 정의 및 직렬화
   - Server-Sent Events (SSE) 기반
   - JSON 형식으로 직렬화
   - 타입 안정성을 위한 TypedDict 사용
+  - 이벤트는 생성 → 직렬화 → 폐기로 수명이 끝나는 일회성 딕셔너리이며,
+    소비자는 `event["type"]` 형태로 접근합니다. 최고 빈도 이벤트는
+    딕셔너리 할당 자체를 생략하는 `*_bytes` 특수화 경로를 사용하세요
 
 **Event Categories**:
   1. **Protocol Events** (RuntimeProtocolEvent): 비즈니스 로직 이벤트
@@ -156,6 +159,11 @@ LangGraph 실행 라이프사이클 (내부용):
 - **RunStarted/Finished/Error**: 전체 실행 시작/완료/에러
 - **NodeStarted/Finished**: 개별 노드 시작/완료
 
+라이프사이클 이벤트는 프로세스 내부에서만 소비됩니다: runloop의
+handle_runtime_event가 직접 딕셔너리를 읽고 상태를 갱신할 뿐,
+직렬화되어 소켓을 건너지 않습니다. `state` 블롭도 참조로 전달되므로
+별도의 바이너리 인코딩(MessagePack 등)은 불필요합니다.
+
 Serialization
 -------------
 
@@ -323,6 +331,21 @@ def execute_action_with_events(action_name: str, arguments: dict):
         ))
 ```
 
+Performance Notes
+-----------------
+
+헬퍼 생성자와 직렬화 함수는 전부 완전히 주석(annotation)된 모듈 레벨
+함수이고 동적 디스패치나 런타임 패칭이 없으므로, 이 파일 하나만
+mypyc/Cython 대상으로 지정해 C 확장으로 빌드해도 와이어 포맷과 공개
+API가 그대로 유지됩니다. 현재 배포는 순수 Python 휠이므로 컴파일
+빌드는 도입하지 않았습니다.
+
+이 모듈의 docstring은 의도적으로 길게 유지합니다(프로토콜 명세 역할).
+서버리스 콜드 스타트처럼 임포트 시간과 상주 메모리가 민감한 배포에서는
+`python -OO`(또는 PYTHONOPTIMIZE=2)로 실행하면 docstring이 바이트코드
+단계에서 제거되어 임포트 핫셋이 수십 KB 줄어듭니다. 어떤 코드 경로도
+__doc__에 런타임으로 의존하지 않으므로 동작 차이는 없습니다.
+
 See Also
 --------
 
@@ -331,12 +354,65 @@ See Also
 - copilotkit.types: CopilotKit 메시지 타입 정의
 """
 
+# PEP 563: 어노테이션을 문자열로 지연 평가한다. 헬퍼의 반환 타입
+# (TextMessageStart 등)이 함수 정의 시점에 클래스 객체로 평가되지 않아
+# 임포트가 가벼워지고, 호출 경로에 런타임 비용이 전혀 남지 않는다
+from __future__ import annotations
+
+import functools
 import json
+import os
+import re
+import sys
 from enum import Enum
-from typing import Union, Optional
-from typing_extensions import TypedDict, Literal, Any, Dict
 
-class RuntimeEventTypes(Enum):
+from copilotkit._json import dumps as _json_dumps
+from typing import Union, Optional, Callable, Iterator
+from typing_extensions import TypedDict, Literal, Any, Dict, NotRequired
+
+try:
+    # 선택적 가속: orjson이 설치되어 있으면 C 구현 인코더로 이벤트를 직렬화
+    # (필수 의존성은 아니며, 없으면 stdlib json으로 동작)
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+
+try:
+    # 선택적 바이너리 와이어 포맷: cbor2가 설치된 경우에만 CBOR 시퀀스
+    # 인코딩을 제공 (JSON 경로에는 영향 없음)
+    import cbor2 as _cbor2
+except ImportError:  # pragma: no cover
+    _cbor2 = None
+
+def _enum_default(obj: Any) -> Any:
+    """orjson/json이 직접 직렬화하지 못하는 Enum 멤버를 .value로 변환합니다."""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+# 이벤트마다 모듈 속성 조회(LOAD_GLOBAL + LOAD_ATTR)를 반복하지 않도록
+# 인코더를 임포트 시점에 한 번만 바인딩
+# (백엔드 선택 체인 orjson → ujson → stdlib은 _json 모듈이 담당)
+_NL = b"\n"
+_dumps = _json_dumps
+
+# JSONL 프레이밍 융합: orjson은 OPT_APPEND_NEWLINE으로 개행을 같은
+# 버퍼 쓰기에서 처리하므로 별도 연결/extend가 필요 없다
+if _orjson is not None:
+    _dumps_nl = functools.partial(_orjson.dumps, option=_orjson.OPT_APPEND_NEWLINE)
+else:
+    def _dumps_nl(obj: Any, default: Any = None) -> bytes:  # pragma: no cover
+        return _dumps(obj, default=default) + _NL
+
+# 개발용 JSON 검증 게이트: 활성화(COPILOTKIT_VALIDATE_JSON=1) 시 호출자가
+# 건넨 문자열 페이로드(args/result/state)가 유효한 JSON인지 헬퍼에서 즉시
+# 확인해, 클라이언트 측에서 한참 뒤에 터지는 파싱 오류를 발생 지점으로
+# 당겨온다. 모듈 레벨 불리언 게이트이므로 비활성(기본, 프로덕션)일 때의
+# 비용은 분기 하나뿐이다.
+_VALIDATE_JSON = os.environ.get("COPILOTKIT_VALIDATE_JSON") == "1"
+_loads = _orjson.loads if _orjson is not None else json.loads
+
+class RuntimeEventTypes(str, Enum):
     """
     Runtime 이벤트 타입 열거형
 
@@ -416,7 +492,7 @@ class RuntimeEventTypes(Enum):
     NODE_STARTED = "NodeStarted"
     NODE_FINISHED = "NodeFinished"
 
-class RuntimeMetaEventName(Enum):
+class RuntimeMetaEventName(str, Enum):
     """
     Runtime 메타 이벤트 이름 열거형
 
@@ -452,6 +528,32 @@ class RuntimeMetaEventName(Enum):
     PREDICT_STATE = "PredictState"
     EXIT = "Exit"
 
+# 헬퍼 생성자가 페이로드에 넣을 이벤트 타입 문자열
+# Enum 멤버 대신 원시 값을 저장하면 직렬화 시 이벤트마다 .value 조회와
+# default 콜백을 치르지 않는다 (모듈 임포트 시 한 번만 계산)
+# sys.intern: Enum 정의 시점에 만들어진 .value 문자열은 자동 인턴
+# 대상이 아니므로 명시적으로 인턴한다. 소비자 쪽 type 태그 비교
+# (event["type"] == "TextMessageContent" 등)가 문자 단위 비교 전에
+# 포인터 동일성으로 단락되고, 태그를 키로 쓰는 딕셔너리(dispatch 등)의
+# 해시 조회도 같은 이득을 본다
+_TYPE_TEXT_MESSAGE_START = sys.intern(
+    RuntimeEventTypes.TEXT_MESSAGE_START.value)
+_TYPE_TEXT_MESSAGE_CONTENT = sys.intern(
+    RuntimeEventTypes.TEXT_MESSAGE_CONTENT.value)
+_TYPE_TEXT_MESSAGE_END = sys.intern(
+    RuntimeEventTypes.TEXT_MESSAGE_END.value)
+_TYPE_ACTION_EXECUTION_START = sys.intern(
+    RuntimeEventTypes.ACTION_EXECUTION_START.value)
+_TYPE_ACTION_EXECUTION_ARGS = sys.intern(
+    RuntimeEventTypes.ACTION_EXECUTION_ARGS.value)
+_TYPE_ACTION_EXECUTION_END = sys.intern(
+    RuntimeEventTypes.ACTION_EXECUTION_END.value)
+_TYPE_ACTION_EXECUTION_RESULT = sys.intern(
+    RuntimeEventTypes.ACTION_EXECUTION_RESULT.value)
+_TYPE_AGENT_STATE_MESSAGE = sys.intern(
+    RuntimeEventTypes.AGENT_STATE_MESSAGE.value)
+_TYPE_META_EVENT = sys.intern(RuntimeEventTypes.META_EVENT.value)
+
 
 class TextMessageStart(TypedDict):
     """
@@ -463,7 +565,7 @@ class TextMessageStart(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.TEXT_MESSAGE_START]
+    type : Literal["TextMessageStart"]
         이벤트 타입 (항상 TEXT_MESSAGE_START)
     messageId : str
         메시지 고유 ID (UUID 권장)
@@ -485,9 +587,9 @@ class TextMessageStart(TypedDict):
         'parentMessageId': 'msg_122'
     }
     """
-    type: Literal[RuntimeEventTypes.TEXT_MESSAGE_START]
+    type: Literal["TextMessageStart"]
     messageId: str
-    parentMessageId: Optional[str]
+    parentMessageId: NotRequired[str]
 
 class TextMessageContent(TypedDict):
     """
@@ -498,7 +600,7 @@ class TextMessageContent(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.TEXT_MESSAGE_CONTENT]
+    type : Literal["TextMessageContent"]
         이벤트 타입 (항상 TEXT_MESSAGE_CONTENT)
     messageId : str
         메시지 ID (TextMessageStart의 messageId와 동일)
@@ -517,7 +619,7 @@ class TextMessageContent(TypedDict):
     - content는 빈 문자열("")도 가능하지만 권장하지 않음
     - 적절한 청크 크기로 분할 (너무 작으면 오버헤드, 너무 크면 지연)
     """
-    type: Literal[RuntimeEventTypes.TEXT_MESSAGE_CONTENT]
+    type: Literal["TextMessageContent"]
     messageId: str
     content: str
 
@@ -530,7 +632,7 @@ class TextMessageEnd(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.TEXT_MESSAGE_END]
+    type : Literal["TextMessageEnd"]
         이벤트 타입 (항상 TEXT_MESSAGE_END)
     messageId : str
         메시지 ID (TextMessageStart의 messageId와 동일)
@@ -549,7 +651,7 @@ class TextMessageEnd(TypedDict):
     - 반드시 TextMessageStart와 쌍을 이루어야 함
     - END 없이 START만 보내면 클라이언트가 무한 대기 상태
     """
-    type: Literal[RuntimeEventTypes.TEXT_MESSAGE_END]
+    type: Literal["TextMessageEnd"]
     messageId: str
 
 class ActionExecutionStart(TypedDict):
@@ -561,7 +663,7 @@ class ActionExecutionStart(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.ACTION_EXECUTION_START]
+    type : Literal["ActionExecutionStart"]
         이벤트 타입 (항상 ACTION_EXECUTION_START)
     actionExecutionId : str
         액션 실행 고유 ID (UUID 권장)
@@ -587,10 +689,10 @@ class ActionExecutionStart(TypedDict):
         'parentMessageId': 'msg_123'
     }
     """
-    type: Literal[RuntimeEventTypes.ACTION_EXECUTION_START]
+    type: Literal["ActionExecutionStart"]
     actionExecutionId: str
     actionName: str
-    parentMessageId: Optional[str]
+    parentMessageId: NotRequired[str]
 
 class ActionExecutionArgs(TypedDict):
     """
@@ -601,7 +703,7 @@ class ActionExecutionArgs(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.ACTION_EXECUTION_ARGS]
+    type : Literal["ActionExecutionArgs"]
         이벤트 타입 (항상 ACTION_EXECUTION_ARGS)
     actionExecutionId : str
         액션 실행 ID (ActionExecutionStart의 actionExecutionId와 동일)
@@ -629,7 +731,7 @@ class ActionExecutionArgs(TypedDict):
     - args는 반드시 유효한 JSON 문자열이어야 함
     - JSON 직렬화 가능한 타입만 포함 (dict, list, str, int, float, bool, None)
     """
-    type: Literal[RuntimeEventTypes.ACTION_EXECUTION_ARGS]
+    type: Literal["ActionExecutionArgs"]
     actionExecutionId: str
     args: str
 
@@ -643,7 +745,7 @@ class ActionExecutionEnd(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.ACTION_EXECUTION_END]
+    type : Literal["ActionExecutionEnd"]
         이벤트 타입 (항상 ACTION_EXECUTION_END)
     actionExecutionId : str
         액션 실행 ID (ActionExecutionStart의 actionExecutionId와 동일)
@@ -662,7 +764,7 @@ class ActionExecutionEnd(TypedDict):
     - START → ARGS → END 순서를 반드시 지켜야 함
     - END 이후 실제 액션 실행 시작
     """
-    type: Literal[RuntimeEventTypes.ACTION_EXECUTION_END]
+    type: Literal["ActionExecutionEnd"]
     actionExecutionId: str
 
 class ActionExecutionResult(TypedDict):
@@ -674,7 +776,7 @@ class ActionExecutionResult(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.ACTION_EXECUTION_RESULT]
+    type : Literal["ActionExecutionResult"]
         이벤트 타입 (항상 ACTION_EXECUTION_RESULT)
     actionName : str
         실행된 액션 이름
@@ -710,8 +812,8 @@ class ActionExecutionResult(TypedDict):
     - 에러 발생 시에도 이 이벤트로 에러 정보 전달
     - END와 RESULT 사이에 시간차가 있을 수 있음 (액션 실행 시간)
     """
-    type: Literal[RuntimeEventTypes.ACTION_EXECUTION_RESULT]
-    actionName: str
+    type: Literal["ActionExecutionResult"]
+    actionName: NotRequired[str]
     actionExecutionId: str
     result: str
 
@@ -724,7 +826,7 @@ class AgentStateMessage(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.AGENT_STATE_MESSAGE]
+    type : Literal["AgentStateMessage"]
         이벤트 타입 (항상 AGENT_STATE_MESSAGE)
     threadId : str
         스레드 ID (대화 세션)
@@ -763,7 +865,7 @@ class AgentStateMessage(TypedDict):
     - state는 JSON 문자열로 직렬화되어야 함
     - LangGraph 에이전트에서 주로 사용됨
     """
-    type: Literal[RuntimeEventTypes.AGENT_STATE_MESSAGE]
+    type: Literal["AgentStateMessage"]
     threadId: str
     agentName: str
     nodeName: str
@@ -782,13 +884,13 @@ class MetaEvent(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.META_EVENT]
+    type : Literal["MetaEvent"]
         이벤트 타입 (항상 META_EVENT)
-    name : RuntimeMetaEventName
-        메타 이벤트 이름
-        - LANG_GRAPH_INTERRUPT_EVENT: 인터럽트 발생
-        - PREDICT_STATE: 상태 예측
-        - EXIT: 명시적 종료
+    name : Literal["LangGraphInterruptEvent", "PredictState", "Exit"]
+        메타 이벤트 이름 (RuntimeMetaEventName 멤버의 .value 원시 문자열)
+        - "LangGraphInterruptEvent": 인터럽트 발생
+        - "PredictState": 상태 예측
+        - "Exit": 명시적 종료
     value : Any
         메타 이벤트 값 (이벤트 타입에 따라 다름)
 
@@ -817,8 +919,8 @@ class MetaEvent(TypedDict):
     - value의 타입과 구조는 name에 따라 다름
     - 인터럽트 이벤트는 LangGraph의 copilotkit_interrupt()와 연동
     """
-    type: Literal[RuntimeEventTypes.META_EVENT]
-    name: RuntimeMetaEventName
+    type: Literal["MetaEvent"]
+    name: Literal["LangGraphInterruptEvent", "PredictState", "Exit"]
     value: Any
 
 class RunStarted(TypedDict):
@@ -830,7 +932,7 @@ class RunStarted(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.RUN_STARTED]
+    type : Literal["RunStarted"]
         이벤트 타입 (항상 RUN_STARTED)
     state : Dict[str, Any]
         실행 시작 시점의 초기 상태
@@ -840,7 +942,7 @@ class RunStarted(TypedDict):
     - RuntimeLifecycleEvent에 속하는 내부 이벤트
     - RuntimeProtocolEvent와 달리 클라이언트에 직접 노출되지 않을 수 있음
     """
-    type: Literal[RuntimeEventTypes.RUN_STARTED]
+    type: Literal["RunStarted"]
     state: Dict[str, Any]
 
 class RunFinished(TypedDict):
@@ -852,7 +954,7 @@ class RunFinished(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.RUN_FINISHED]
+    type : Literal["RunFinished"]
         이벤트 타입 (항상 RUN_FINISHED)
     state : Dict[str, Any]
         실행 완료 시점의 최종 상태
@@ -862,7 +964,7 @@ class RunFinished(TypedDict):
     - RuntimeLifecycleEvent에 속하는 내부 이벤트
     - 정상 완료 시 발생 (에러는 RunError)
     """
-    type: Literal[RuntimeEventTypes.RUN_FINISHED]
+    type: Literal["RunFinished"]
     state: Dict[str, Any]
 
 class RunError(TypedDict):
@@ -874,7 +976,7 @@ class RunError(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.RUN_ERROR]
+    type : Literal["RunError"]
         이벤트 타입 (항상 RUN_ERROR)
     error : Any
         에러 정보 (Exception 객체 또는 에러 메시지)
@@ -884,7 +986,7 @@ class RunError(TypedDict):
     - RuntimeLifecycleEvent에 속하는 내부 이벤트
     - 에러 발생 시 RunFinished 대신 이 이벤트 발생
     """
-    type: Literal[RuntimeEventTypes.RUN_ERROR]
+    type: Literal["RunError"]
     error: Any
 
 class NodeStarted(TypedDict):
@@ -896,7 +998,7 @@ class NodeStarted(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.NODE_STARTED]
+    type : Literal["NodeStarted"]
         이벤트 타입 (항상 NODE_STARTED)
     node_name : str
         시작된 노드 이름
@@ -908,7 +1010,7 @@ class NodeStarted(TypedDict):
     - RuntimeLifecycleEvent에 속하는 내부 이벤트
     - LangGraph 그래프의 각 노드마다 발생
     """
-    type: Literal[RuntimeEventTypes.NODE_STARTED]
+    type: Literal["NodeStarted"]
     node_name: str
     state: Dict[str, Any]
 
@@ -921,7 +1023,7 @@ class NodeFinished(TypedDict):
 
     Attributes
     ----------
-    type : Literal[RuntimeEventTypes.NODE_FINISHED]
+    type : Literal["NodeFinished"]
         이벤트 타입 (항상 NODE_FINISHED)
     node_name : str
         완료된 노드 이름
@@ -934,7 +1036,7 @@ class NodeFinished(TypedDict):
     - LangGraph 그래프의 각 노드마다 발생
     - NodeStarted와 쌍을 이룸
     """
-    type: Literal[RuntimeEventTypes.NODE_FINISHED]
+    type: Literal["NodeFinished"]
     node_name: str
     state: Dict[str, Any]
 
@@ -986,6 +1088,39 @@ Examples
 ...         print(f"Node {event['node_name']} started")
 """
 
+PROTOCOL_EVENT_TYPES = frozenset((
+    _TYPE_TEXT_MESSAGE_START,
+    _TYPE_TEXT_MESSAGE_CONTENT,
+    _TYPE_TEXT_MESSAGE_END,
+    _TYPE_ACTION_EXECUTION_START,
+    _TYPE_ACTION_EXECUTION_ARGS,
+    _TYPE_ACTION_EXECUTION_END,
+    _TYPE_ACTION_EXECUTION_RESULT,
+    _TYPE_AGENT_STATE_MESSAGE,
+    _TYPE_META_EVENT,
+))
+"""
+RuntimeProtocolEvent에 속하는 type 태그 문자열 집합
+
+`type` 필드는 tagged union의 판별자(discriminator)입니다.
+소비자는 긴 if/elif 체인 대신 이 집합으로 O(1) 분류를 할 수 있습니다:
+
+>>> if event["type"] in PROTOCOL_EVENT_TYPES: ...
+"""
+
+LIFECYCLE_EVENT_TYPES = frozenset((
+    RuntimeEventTypes.RUN_STARTED.value,
+    RuntimeEventTypes.RUN_FINISHED.value,
+    RuntimeEventTypes.RUN_ERROR.value,
+    RuntimeEventTypes.NODE_STARTED.value,
+    RuntimeEventTypes.NODE_FINISHED.value,
+))
+"""
+RuntimeLifecycleEvent에 속하는 type 태그 문자열 집합
+
+PROTOCOL_EVENT_TYPES와 함께 전체 이벤트 공간을 분할합니다.
+"""
+
 RuntimeEvent = Union[
     RuntimeProtocolEvent,
     RuntimeLifecycleEvent,
@@ -1075,11 +1210,13 @@ def text_message_start(
     >>> print(event["type"])
     RuntimeEventTypes.TEXT_MESSAGE_START
     """
-    return {
-        "type": RuntimeEventTypes.TEXT_MESSAGE_START,
+    event: TextMessageStart = {
+        "type": _TYPE_TEXT_MESSAGE_START,
         "messageId": message_id,
-        "parentMessageId": parent_message_id
     }
+    if parent_message_id is not None:
+        event["parentMessageId"] = parent_message_id
+    return event
 
 def text_message_content(*, message_id: str, content: str) -> TextMessageContent:
     """
@@ -1106,7 +1243,7 @@ def text_message_content(*, message_id: str, content: str) -> TextMessageContent
     'Hello'
     """
     return {
-        "type": RuntimeEventTypes.TEXT_MESSAGE_CONTENT,
+        "type": _TYPE_TEXT_MESSAGE_CONTENT,
         "messageId": message_id,
         "content": content
     }
@@ -1134,7 +1271,7 @@ def text_message_end(*, message_id: str) -> TextMessageEnd:
     RuntimeEventTypes.TEXT_MESSAGE_END
     """
     return {
-        "type": RuntimeEventTypes.TEXT_MESSAGE_END,
+        "type": _TYPE_TEXT_MESSAGE_END,
         "messageId": message_id
     }
 
@@ -1183,14 +1320,20 @@ def action_execution_start(
     action_execution_end : 액션 인자 전달 완료
     action_execution_result : 액션 실행 결과 반환
     """
-    return {
-        "type": RuntimeEventTypes.ACTION_EXECUTION_START,
+    event: ActionExecutionStart = {
+        "type": _TYPE_ACTION_EXECUTION_START,
         "actionExecutionId": action_execution_id,
         "actionName": action_name,
-        "parentMessageId": parent_message_id
     }
+    if parent_message_id is not None:
+        event["parentMessageId"] = parent_message_id
+    return event
 
-def action_execution_args(*, action_execution_id: str, args: str) -> ActionExecutionArgs:
+def action_execution_args(
+        *,
+        action_execution_id: str,
+        args: Union[str, Any]
+    ) -> ActionExecutionArgs:
     """
     ActionExecutionArgs 이벤트를 생성하는 헬퍼 함수
 
@@ -1233,8 +1376,14 @@ def action_execution_args(*, action_execution_id: str, args: str) -> ActionExecu
     action_execution_start : 액션 실행 시작
     action_execution_end : 액션 인자 전달 완료
     """
+    if not isinstance(args, str):
+        # 호출자가 stdlib json.dumps로 선-인코딩할 필요 없이
+        # 바인딩된 고속 인코더로 와이어 계약(JSON 문자열)을 맞춘다
+        args = _dumps(args, default=_enum_default).decode("utf-8")
+    elif _VALIDATE_JSON:
+        _loads(args)
     return {
-        "type": RuntimeEventTypes.ACTION_EXECUTION_ARGS,
+        "type": _TYPE_ACTION_EXECUTION_ARGS,
         "actionExecutionId": action_execution_id,
         "args": args
     }
@@ -1276,7 +1425,7 @@ def action_execution_end(*, action_execution_id: str) -> ActionExecutionEnd:
     action_execution_result : 액션 실행 결과 반환
     """
     return {
-        "type": RuntimeEventTypes.ACTION_EXECUTION_END,
+        "type": _TYPE_ACTION_EXECUTION_END,
         "actionExecutionId": action_execution_id
     }
 
@@ -1284,7 +1433,8 @@ def action_execution_result(
         *,
         action_name: str,
         action_execution_id: str,
-        result: str
+        result: Union[str, Any],
+        omit_action_name: bool = False
     ) -> ActionExecutionResult:
     """
     ActionExecutionResult 이벤트를 생성하는 헬퍼 함수
@@ -1340,8 +1490,20 @@ def action_execution_result(
     action_execution_start : 액션 실행 시작
     action_execution_end : 액션 인자 전달 완료
     """
+    if not isinstance(result, str):
+        result = _dumps(result, default=_enum_default).decode("utf-8")
+    elif _VALIDATE_JSON:
+        _loads(result)
+    if omit_action_name:
+        # actionExecutionId만으로 액션을 식별할 수 있는 클라이언트는
+        # Start 이벤트에서 이미 받은 actionName의 중복 전송을 생략 가능
+        return {
+            "type": _TYPE_ACTION_EXECUTION_RESULT,
+            "actionExecutionId": action_execution_id,
+            "result": result
+        }
     return {
-        "type": RuntimeEventTypes.ACTION_EXECUTION_RESULT,
+        "type": _TYPE_ACTION_EXECUTION_RESULT,
         "actionName": action_name,
         "actionExecutionId": action_execution_id,
         "result": result
@@ -1355,7 +1517,7 @@ def agent_state_message( # pylint: disable=too-many-arguments
         run_id: str,
         active: bool,
         role: str,
-        state: str,
+        state: Union[str, Any],
         running: bool
   ) -> AgentStateMessage:
     """
@@ -1414,8 +1576,12 @@ def agent_state_message( # pylint: disable=too-many-arguments
     NodeStarted : 노드 시작 이벤트
     NodeFinished : 노드 완료 이벤트
     """
+    if not isinstance(state, str):
+        state = encode_state(state)
+    elif _VALIDATE_JSON:
+        _loads(state)
     return {
-        "type": RuntimeEventTypes.AGENT_STATE_MESSAGE,
+        "type": _TYPE_AGENT_STATE_MESSAGE,
         "threadId": thread_id,
         "agentName": agent_name,
         "nodeName": node_name,
@@ -1488,8 +1654,8 @@ def meta_event(*, name: RuntimeMetaEventName, value: Any) -> MetaEvent:
     MetaEvent : 메타 이벤트 TypedDict
     """
     return {
-        "type": RuntimeEventTypes.META_EVENT,
-        "name": name,
+        "type": _TYPE_META_EVENT,
+        "name": name.value,
         "value": value
     }
 
@@ -1538,21 +1704,82 @@ def emit_runtime_events(*events: RuntimeProtocolEvent) -> str:
 
     직렬화 프로세스:
     1. 각 이벤트를 순회
-    2. Enum 값을 .value로 변환
-    3. JSON 문자열로 직렬화
+    2. Enum 값을 .value로 변환 (default 콜백)
+    3. JSON 문자열로 직렬화 (orjson 설치 시 C 인코더 사용)
     4. 개행 문자로 연결
 
     See Also
     --------
     emit_runtime_event : 단일 이벤트 직렬화
+    emit_runtime_events_ndjson : bytes를 반환하는 벌크 직렬화
+    """
+    if len(events) == 1:
+        # 가장 흔한 호출 형태(이벤트 1개)는 버퍼 누적 없이
+        # 인코더 호출 한 번으로 처리
+        return _dumps_nl(events[0], default=_enum_default).decode("utf-8")
+    return emit_runtime_events_ndjson(events).decode("utf-8")
+
+def emit_runtime_events_ndjson(events) -> bytes:
+    """
+    이벤트 시퀀스를 NDJSON bytes로 벌크 직렬화합니다.
+
+    가변 인자 언패킹 없이 리스트/튜플을 그대로 받아 정확한 크기로
+    한 번에 할당된 버퍼로 연결하므로, 버스트를 ASGI send 한 번으로 내보낼 때
+    중간 문자열 생성과 utf-8 재인코딩을 모두 생략할 수 있습니다.
+
+    Parameters
+    ----------
+    events : Iterable[RuntimeProtocolEvent]
+        직렬화할 이벤트 시퀀스
+
+    Returns
+    -------
+    bytes
+        각 이벤트가 개행으로 끝나는 NDJSON 버퍼
+
+    See Also
+    --------
+    emit_runtime_events : 문자열을 반환하는 가변 인자 버전
+    """
+    # 프레임을 리스트로 먼저 구체화한 뒤 join: join은 리스트를 두 번
+    # 훑어 총 길이를 계산하고 결과 버퍼를 정확한 크기로 한 번에 할당하므로
+    # bytearray 증식(재할당+복사)이 없다 (개행은 인코더가 붙임)
+    return b"".join(
+        [_dumps_nl(event, default=_enum_default) for event in events]
+    )
+
+def iter_runtime_events(*events: RuntimeProtocolEvent) -> Iterator[bytes]:
     """
-    def serialize_event(event):
-        # Convert enum values to their string representation
-        if isinstance(event, dict):
-            return {k: (v.value if isinstance(v, Enum) else v) for k, v in event.items()}
-        return event
+    이벤트를 JSONL bytes 프레임으로 하나씩 늦게(lazily) 직렬화합니다.
 
-    return "\n".join(json.dumps(serialize_event(event)) for event in events) + "\n"
+    emit_runtime_events_ndjson이 전체 버스트를 하나의 버퍼로 구체화하는
+    것과 달리, 이 제너레이터는 프레임을 하나씩 내보내므로 스트리밍
+    핸들러가 N번째 프레임을 소켓에 쓰는 동안 이벤트 루프가 N+1번째
+    직렬화와 겹칠 수 있고, 피크 메모리도 이벤트 하나 크기로 제한됩니다.
+    이벤트 수가 많거나 개별 페이로드가 큰 경우에 사용하세요.
+
+    Parameters
+    ----------
+    *events : RuntimeProtocolEvent
+        직렬화할 이벤트들 (가변 인자)
+
+    Yields
+    ------
+    bytes
+        개행으로 끝나는 단일 JSONL 프레임
+
+    Examples
+    --------
+    >>> async def stream(send, events):
+    ...     for frame in iter_runtime_events(*events):
+    ...         await send(frame)
+
+    See Also
+    --------
+    emit_runtime_events_ndjson : 버스트 전체를 단일 버퍼로 직렬화
+    """
+    for event in events:
+        yield _dumps_nl(event, default=_enum_default)
 
 def emit_runtime_event(event: RuntimeProtocolEvent) -> str:
     """
@@ -1600,4 +1827,306 @@ def emit_runtime_event(event: RuntimeProtocolEvent) -> str:
     --------
     emit_runtime_events : 여러 이벤트 직렬화
     """
-    return emit_runtime_events(event)
+    # 단일 이벤트는 bytearray 누적 없이 인코더 호출 한 번으로 끝냄
+    return _dumps_nl(event, default=_enum_default).decode("utf-8")
+
+# 고정 형태 이벤트의 프레이밍 조각 (임포트 시 한 번만 생성)
+# TextMessageContent는 LLM 토큰 청크마다 한 번씩 만들어지는 최고 빈도
+# 이벤트이므로, 딕셔너리 구성과 제네릭 인코더 디스패치를 건너뛰고
+# 최종 JSONL bytes를 직접 조립하는 특수화 경로를 제공한다
+_TMC_PREFIX = b'{"type":"TextMessageContent","messageId":'
+_TMC_CONTENT = b',"content":'
+_TMS_PREFIX = b'{"type":"TextMessageStart","messageId":'
+_TMS_PARENT = b',"parentMessageId":'
+_TME_PREFIX = b'{"type":"TextMessageEnd","messageId":'
+_FRAME_END = b'}\n'
+
+# UUID/nanoid/snowflake류 ID는 JSON 이스케이프 대상 문자가 없으므로
+# 인코더 호출 없이 따옴표만 둘러서 내보낼 수 있다
+_SAFE_ID = re.compile(r"\A[A-Za-z0-9_\-]+\Z").match
+_QUOTE = b'"'
+
+def _id_bytes(value: str) -> bytes:
+    """ID 문자열을 JSON 문자열 bytes로 변환합니다 (안전하면 무이스케이프)."""
+    if _SAFE_ID(value) is not None:
+        return _QUOTE + value.encode("ascii") + _QUOTE
+    return _dumps(value)
+
+def text_message_content_bytes(message_id: str, content: str) -> bytes:
+    """
+    TextMessageContent 이벤트를 JSONL bytes로 직접 조립합니다.
+
+    `emit_runtime_event(text_message_content(...))`와 같은 출력을
+    만들되, 중간 딕셔너리 생성과 제네릭 인코더 순회를 생략합니다.
+    문자열 이스케이프는 여전히 인코더(_dumps)에 위임하므로 안전합니다.
+
+    Parameters
+    ----------
+    message_id : str
+        메시지 ID
+    content : str
+        메시지 내용 청크
+
+    Returns
+    -------
+    bytes
+        개행으로 끝나는 단일 JSONL 프레임
+    """
+    return (
+        _TMC_PREFIX + _id_bytes(message_id)
+        + _TMC_CONTENT + _dumps(content)
+        + _FRAME_END
+    )
+
+def text_message_content_batch_bytes(message_id: str, chunks) -> bytes:
+    """
+    같은 메시지의 content 청크 여러 개를 JSONL bytes로 일괄 조립합니다.
+
+    토큰 단위 스트리밍은 동일한 messageId를 가진 TextMessageContent를
+    수십 개씩 만들어냅니다. 청크가 이미 여러 개 모여 있다면 이 헬퍼가
+    프레임 접두사(타입 태그 + messageId 인코딩)를 한 번만 계산해 전체
+    버스트에 재사용하므로, 청크당 비용이 content 이스케이프 하나로
+    줄어듭니다. 와이어 출력은 개별 text_message_content_bytes 호출을
+    연접한 것과 동일하여 클라이언트 변경이 필요 없습니다.
+
+    Parameters
+    ----------
+    message_id : str
+        메시지 ID (모든 청크에 공통)
+    chunks : Iterable[str]
+        메시지 내용 청크 시퀀스
+
+    Returns
+    -------
+    bytes
+        청크당 한 줄인 JSONL 버퍼
+
+    See Also
+    --------
+    text_message_content_bytes : 단일 청크 버전
+    """
+    prefix = _TMC_PREFIX + _id_bytes(message_id) + _TMC_CONTENT
+    return b"".join(
+        [prefix + _dumps(chunk) + _FRAME_END for chunk in chunks]
+    )
+
+def text_message_start_bytes(
+    message_id: str,
+    parent_message_id: Optional[str] = None,
+) -> bytes:
+    """TextMessageStart 이벤트의 JSONL bytes 특수화 경로입니다."""
+    if parent_message_id is None:
+        return _TMS_PREFIX + _id_bytes(message_id) + _FRAME_END
+    return (
+        _TMS_PREFIX + _id_bytes(message_id)
+        + _TMS_PARENT + _id_bytes(parent_message_id)
+        + _FRAME_END
+    )
+
+def text_message_end_bytes(message_id: str) -> bytes:
+    """TextMessageEnd 이벤트의 JSONL bytes 특수화 경로입니다."""
+    return _TME_PREFIX + _id_bytes(message_id) + _FRAME_END
+
+# 액션 실행 이벤트의 프레이밍 조각
+# ActionExecutionArgs는 LLM이 도구 인자를 토큰 단위로 스트리밍할 때
+# TextMessageContent와 같은 빈도로 발생하므로 동일한 특수화를 적용한다
+_AES_PREFIX = b'{"type":"ActionExecutionStart","actionExecutionId":'
+_AES_NAME = b',"actionName":'
+_AES_PARENT = b',"parentMessageId":'
+_AEA_PREFIX = b'{"type":"ActionExecutionArgs","actionExecutionId":'
+_AEA_ARGS = b',"args":'
+_AEE_PREFIX = b'{"type":"ActionExecutionEnd","actionExecutionId":'
+
+def action_execution_start_bytes(
+    action_execution_id: str,
+    action_name: str,
+    parent_message_id: Optional[str] = None,
+) -> bytes:
+    """ActionExecutionStart 이벤트의 JSONL bytes 특수화 경로입니다."""
+    frame = (
+        _AES_PREFIX + _id_bytes(action_execution_id)
+        + _AES_NAME + _id_bytes(action_name)
+    )
+    if parent_message_id is None:
+        return frame + _FRAME_END
+    return frame + _AES_PARENT + _id_bytes(parent_message_id) + _FRAME_END
+
+def action_execution_args_bytes(action_execution_id: str, args: str) -> bytes:
+    """
+    ActionExecutionArgs 이벤트를 JSONL bytes로 직접 조립합니다.
+
+    `emit_runtime_event(action_execution_args(...))`와 같은 출력을
+    만들되, 중간 딕셔너리 생성과 제네릭 인코더 순회를 생략합니다.
+    args(JSON 문자열)의 이스케이프는 인코더(_dumps)에 위임합니다.
+
+    Parameters
+    ----------
+    action_execution_id : str
+        액션 실행 ID
+    args : str
+        JSON 직렬화된 인자 청크
+
+    Returns
+    -------
+    bytes
+        개행으로 끝나는 단일 JSONL 프레임
+    """
+    return (
+        _AEA_PREFIX + _id_bytes(action_execution_id)
+        + _AEA_ARGS + _dumps(args)
+        + _FRAME_END
+    )
+
+def action_execution_end_bytes(action_execution_id: str) -> bytes:
+    """ActionExecutionEnd 이벤트의 JSONL bytes 특수화 경로입니다."""
+    return _AEE_PREFIX + _id_bytes(action_execution_id) + _FRAME_END
+
+def emit_runtime_events_cbor_seq(events) -> bytes:
+    """
+    이벤트 시퀀스를 CBOR 시퀀스(RFC 8742) bytes로 직렬화합니다.
+
+    `Accept: application/cbor-seq`를 광고하는 클라이언트를 위한 선택적
+    바이너리 경로입니다. CBOR는 JSON과 같은 데이터 모델을 유지하면서
+    페이로드가 작고 클라이언트 파싱이 빠릅니다. cbor2가 설치되지 않은
+    환경에서는 사용할 수 없으며, 기존 JSON 클라이언트 경로는 이 함수와
+    무관하게 동작합니다.
+
+    Parameters
+    ----------
+    events : Iterable[RuntimeProtocolEvent]
+        직렬화할 이벤트 시퀀스
+
+    Returns
+    -------
+    bytes
+        연접된 CBOR 레코드 (RFC 8742 시퀀스)
+
+    Raises
+    ------
+    RuntimeError
+        cbor2 패키지가 설치되지 않은 경우
+
+    See Also
+    --------
+    emit_runtime_events_ndjson : 기본 JSON Lines 경로
+    """
+    if _cbor2 is None:
+        raise RuntimeError(
+            "CBOR encoding requires the optional 'cbor2' package"
+        )
+    buf = bytearray()
+    extend = buf.extend
+    for event in events:
+        extend(_cbor2.dumps(event))
+    return bytes(buf)
+
+# SSE 프레이밍 조각
+_SSE_DATA = b"data: "
+_SSE_END = b"\n\n"
+
+def as_sse_bytes(event: RuntimeProtocolEvent) -> bytes:
+    """
+    이벤트를 SSE `data:` 프레임 bytes로 직렬화합니다.
+
+    FastAPI에서 jsonable_encoder/pydantic 왕복 없이 사전 직렬화된
+    응답을 바로 반환할 때 사용합니다:
+
+    >>> Response(content=as_sse_bytes(event), media_type="text/event-stream")
+
+    Parameters
+    ----------
+    event : RuntimeProtocolEvent
+        직렬화할 이벤트
+
+    Returns
+    -------
+    bytes
+        `data: {...}\\n\\n` 형태의 단일 SSE 프레임
+
+    See Also
+    --------
+    emit_runtime_event : JSON Lines 직렬화 (SSE 프레이밍 없음)
+    """
+    return _SSE_DATA + _dumps(event, default=_enum_default) + _SSE_END
+
+def encode_state(state: Any) -> str:
+    """
+    에이전트 상태 객체를 JSON 문자열로 인코딩합니다.
+
+    AgentStateMessage.state의 와이어 계약은 JSON 문자열이므로 내부
+    인코딩 자체는 피할 수 없지만, orjson이 설치된 환경에서는 C 인코더로
+    한 번에 처리하고 numpy 배열(OPT_SERIALIZE_NUMPY)도 tolist() 왕복
+    없이 직접 직렬화합니다. LangGraph 상태에 임베딩/메시지 배열이 담긴
+    경우 효과가 큽니다.
+
+    Parameters
+    ----------
+    state : Any
+        JSON으로 인코딩할 상태 객체
+
+    Returns
+    -------
+    str
+        JSON 문자열
+    """
+    if _orjson is not None:
+        return _orjson.dumps(
+            state,
+            default=_enum_default,
+            option=_orjson.OPT_SERIALIZE_NUMPY,
+        ).decode("utf-8")
+    return json.dumps(state, default=_enum_default, ensure_ascii=False)
+
+class RuntimeEventHandlerTable(TypedDict, total=False):
+    """
+    이벤트 타입 태그 → 핸들러 매핑 (dispatch()용)
+
+    키는 이벤트의 `type` 문자열이며, 필요한 타입만 등록하면 됩니다.
+    정적 타입 검사기가 키 오타와 누락을 잡아줍니다.
+    """
+    TextMessageStart: Callable[[TextMessageStart], Any]
+    TextMessageContent: Callable[[TextMessageContent], Any]
+    TextMessageEnd: Callable[[TextMessageEnd], Any]
+    ActionExecutionStart: Callable[[ActionExecutionStart], Any]
+    ActionExecutionArgs: Callable[[ActionExecutionArgs], Any]
+    ActionExecutionEnd: Callable[[ActionExecutionEnd], Any]
+    ActionExecutionResult: Callable[[ActionExecutionResult], Any]
+    AgentStateMessage: Callable[[AgentStateMessage], Any]
+    MetaEvent: Callable[[MetaEvent], Any]
+    RunStarted: Callable[[RunStarted], Any]
+    RunFinished: Callable[[RunFinished], Any]
+    RunError: Callable[[RunError], Any]
+    NodeStarted: Callable[[NodeStarted], Any]
+    NodeFinished: Callable[[NodeFinished], Any]
+
+def dispatch(event: RuntimeEvent, handlers: RuntimeEventHandlerTable) -> Any:
+    """
+    이벤트를 타입 태그로 핸들러 테이블에서 O(1) 디스패치합니다.
+
+    type 태그는 인턴된 문자열 리터럴이므로 딕셔너리 조회가 해시 한 번으로
+    끝납니다. 긴 if/elif 체인(이벤트당 N번의 비교)을 대체하며, 등록되지
+    않은 타입은 조용히 무시하고 None을 반환합니다.
+
+    Parameters
+    ----------
+    event : RuntimeEvent
+        디스패치할 이벤트
+    handlers : RuntimeEventHandlerTable
+        타입 태그 → 핸들러 매핑
+
+    Returns
+    -------
+    Any
+        핸들러의 반환값 (등록된 핸들러가 없으면 None)
+
+    Examples
+    --------
+    >>> handled = dispatch(event, {
+    ...     "TextMessageContent": lambda e: print(e["content"]),
+    ...     "RunError": lambda e: log.error(e["error"]),
+    ... })
+    """
+    handler = handlers.get(event["type"])
+    if handler is None:
+        return None
+    return handler(event)
@@ -32,7 +32,7 @@ flowchart TB
     end
 
     subgraph "Context Management"
-        QueueCtx[Queue Context<br/>asyncio.Queue]
+        QueueCtx[Queue Context<br/>_EventChannel]
         ExecCtx[Execution Context<br/>CopilotKitRunExecution]
     end
 
@@ -69,7 +69,7 @@ Context Management Flow
 sequenceDiagram
     participant Caller as 호출자
     participant RunLoop as copilotkit_run
-    participant Queue as asyncio.Queue
+    participant Queue as _EventChannel
     participant Ctx as Context Variables
     participant Agent as 에이전트 태스크
 
@@ -145,7 +145,7 @@ Core Concepts
    - Execution Context: 실행 상태 추적
 
 2. **Event Queue (이벤트 큐)**
-   - asyncio.Queue 기반 비동기 이벤트 처리
+   - deque + asyncio.Event 기반 SPSC 채널(_EventChannel)로 처리
    - Priority 지원: 우선순위 이벤트 처리
    - yield_control(): 이벤트 루프 제어권 양보
 
@@ -259,12 +259,15 @@ action : 액션 정의 및 실행
 
 import asyncio
 import contextvars
-import json
+import sys
+import time
 import traceback
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Callable
 from pydantic import BaseModel
-from typing_extensions import Any, Dict, Optional, List, TypedDict, cast
-from partialjson.json_parser import JSONParser as PartialJSONParser
+from typing_extensions import Any, Dict, Optional, List, cast
+from ._incremental_json import IncrementalToolArgsParser
 
 from .protocol import (
     RuntimeEvent,
@@ -272,6 +275,7 @@ from .protocol import (
     RuntimeMetaEventName,
     emit_runtime_event,
     emit_runtime_events,
+    encode_state,
     agent_state_message,
     AgentStateMessage,
     PredictStateConfig,
@@ -287,15 +291,15 @@ async def yield_control():
 
     Notes
     -----
-    - asyncio.sleep(0)과 유사하지만 더 명시적
     - 우선순위 이벤트 처리를 위해 사용
     - 이벤트 큐 처리 후 제어권 양보에 사용
 
     동작 원리:
-    1. 현재 실행 중인 이벤트 루프 가져오기
-    2. 즉시 완료될 Future 생성
-    3. call_soon으로 Future를 다음 이벤트 루프 틱에 완료
-    4. Future가 완료될 때까지 대기 (다른 태스크 실행 기회 제공)
+    asyncio.sleep(0)에 위임합니다. delay=0은 C 구현(_asynciomodule)의
+    특수 경로를 타서 타이머 힙을 건드리지 않고 다음 틱으로 재스케줄만
+    합니다. 파이썬 레벨에서 Future를 만들고 call_soon으로 완료시키던
+    이전 구현과 의미는 같지만, 틱마다 치르는 인터프리터 오버헤드가
+    없습니다 (queue_put과 소비자 루프가 이벤트마다 호출하는 경로).
 
     Examples
     --------
@@ -309,15 +313,103 @@ async def yield_control():
     --------
     queue_put : 이벤트 큐에 넣기 (내부적으로 yield_control 사용)
     """
-    loop = asyncio.get_running_loop()
-    future = loop.create_future()
-    loop.call_soon(future.set_result, None)
-    await future
+    await asyncio.sleep(0)
 
 
-class CopilotKitRunExecution(TypedDict):
+class _EventChannel:
     """
-    CopilotKit 런 실행 상태를 추적하는 TypedDict
+    단일 생산자/단일 소비자(SPSC) 이벤트 채널
+
+    copilotkit_run의 이벤트 전달은 같은 이벤트 루프 안에서 에이전트
+    태스크(생산자) 하나와 소비자 루프 하나만 사용합니다. asyncio.Queue는
+    다중 대기자를 위한 Future/잠금 관리를 내장해 이 용도에는 과한
+    프리미티브이므로, deque 하나와 asyncio.Event 하나로 같은 계약을
+    더 싸게 제공합니다: put은 append + Event.set, get은 deque가 빌 때만
+    Event를 기다립니다.
+
+    asyncio.Queue에서 쓰던 put_nowait/get 서브셋과 시그니처가 같아
+    queue_put과 소비자 루프는 그대로 동작합니다 (task_done은 불필요).
+
+    소비자가 get()에서 실제로 잠들어 있을 때(_parked)만 put이 Event를
+    set합니다. 소비자가 깨어서 다른 일을 하는 동안의 put은 deque append
+    한 번이 전부이고, 소비자는 대기 전에 deque를 다시 확인하므로 이벤트를
+    놓치지 않습니다. 생산자와 소비자가 같은 이벤트 루프에서 교대로
+    실행되는 SPSC 구조라서 플래그에 경쟁 조건이 없습니다.
+
+    우선순위 이벤트(EXIT 메타 이벤트 등)는 별도 deque에 쌓이고 항상
+    일반 deque보다 먼저 소비됩니다. 단일 FIFO에서는 priority=True가
+    이미 쌓인 일반 이벤트를 추월할 수 없었습니다 — 이제 CONTENT 청크가
+    밀려 있어도 EXIT가 실제로 선점합니다.
+
+    일반 deque는 maxsize로 제한됩니다: 소비자(SSE → 클라이언트)가
+    생산 속도를 따라가지 못하면 put()이 자리가 날 때까지 대기해
+    역압(backpressure)이 에이전트까지 전파되고, 큐가 무한정 자라며
+    메모리를 잠식하는 일을 막습니다. 우선순위 put은 제한을 우회합니다
+    (긴급 이벤트가 역압에 막히면 안 되므로).
+    """
+    __slots__ = ("_items", "_prio", "_ready", "_parked", "_maxsize", "_space")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._items: deque = deque()
+        self._prio: deque = deque()
+        self._ready = asyncio.Event()
+        self._parked = False
+        self._maxsize = maxsize
+        self._space = asyncio.Event()
+        self._space.set()
+
+    def put_nowait(self, event: "RuntimeEvent", priority: bool = False) -> None:
+        """이벤트를 채널에 넣고, 잠들어 있는 소비자만 깨웁니다 (논블로킹, 무제한)."""
+        if priority:
+            self._prio.append(event)
+        else:
+            self._items.append(event)
+        if self._parked:
+            self._ready.set()
+
+    async def put(self, event: "RuntimeEvent", priority: bool = False) -> None:
+        """이벤트를 채널에 넣습니다. 일반 deque가 가득 차면 자리가 날 때까지 대기합니다."""
+        if not priority:
+            while len(self._items) >= self._maxsize:
+                self._space.clear()
+                await self._space.wait()
+        self.put_nowait(event, priority)
+
+    async def get(self) -> "RuntimeEvent":
+        """다음 이벤트를 반환합니다 (우선순위 먼저). 비어 있으면 put까지 대기합니다."""
+        items = self._items
+        prio = self._prio
+        while not (prio or items):
+            self._ready.clear()
+            self._parked = True
+            try:
+                await self._ready.wait()
+            finally:
+                self._parked = False
+        if prio:
+            return prio.popleft()
+        event = items.popleft()
+        if not self._space.is_set() and len(items) < self._maxsize:
+            self._space.set()
+        return event
+
+    def drain(self) -> list:
+        """쌓여 있는 이벤트를 전부 꺼내 리스트로 반환합니다 (우선순위 먼저, 논블로킹)."""
+        batch = []
+        append = batch.append
+        for items in (self._prio, self._items):
+            popleft = items.popleft
+            while items:
+                append(popleft())
+        if not self._space.is_set():
+            self._space.set()
+        return batch
+
+
+@dataclass(slots=True)
+class CopilotKitRunExecution:
+    """
+    CopilotKit 런 실행 상태를 추적하는 슬롯 데이터클래스
 
     에이전트 실행의 전체 상태를 관리합니다.
     이벤트 처리, 상태 예측, 실행 제어에 필요한 모든 정보를 포함합니다.
@@ -352,9 +444,21 @@ class CopilotKitRunExecution(TypedDict):
         실시간 액션 인자 파싱으로 채워짐
         NODE_FINISHED 시 초기화
     argument_buffer : str
-        액션 인자 누적 버퍼
-        ACTION_EXECUTION_ARGS 이벤트 청크를 누적
-        Partial JSON 파싱에 사용
+        액션 인자 누적 버퍼 (하위 호환용으로 유지)
+        증분 파서 도입 후에는 누적하지 않으며 항상 빈 문자열
+    incremental_parser : Optional[IncrementalToolArgsParser]
+        툴 인자 증분 파서
+        ACTION_EXECUTION_START 시 생성, ARGS 델타만 소비
+        NODE_FINISHED 시 None으로 초기화
+    predict_state_entries : List[Any]
+        현재 툴 호출에 해당하는 (state_key, PredictStateConfig) 쌍 목록
+        ACTION_EXECUTION_START 시 설정에서 한 번 추려냄
+        ARGS 청크마다 전체 설정을 재스캔하지 않기 위한 인덱스
+    predict_state_dirty : bool
+        디바운스 윈도우 안에서 눌러둔 예측 상태 변경이 있는지
+        ACTION_EXECUTION_END 또는 윈도우 통과 시 한 번에 방출
+    last_predict_emit : float
+        마지막 AgentStateMessage 방출 시각 (time.monotonic 기준)
     current_tool_call : Optional[str]
         현재 실행 중인 툴/액션 이름
         ACTION_EXECUTION_START 시 설정
@@ -412,6 +516,9 @@ class CopilotKitRunExecution(TypedDict):
     - 이 객체는 copilotkit_run() 함수에서 관리됩니다
     - 직접 수정하지 말고 이벤트를 통해 업데이트하세요
     - 컨텍스트 변수로 저장되어 비동기 태스크 간 공유됩니다
+    - slots=True: 필드 접근이 해시 조회 없는 슬롯 LOAD_ATTR이고,
+      인스턴스가 딕셔너리 없이 고정 슬롯에 저장되어 메모리도 작습니다
+      (이벤트마다 3~5회 읽고 쓰는 핫 구조체)
 
     State Lifecycle:
     1. RUN_STARTED: 초기 상태 설정
@@ -430,19 +537,27 @@ class CopilotKitRunExecution(TypedDict):
     thread_id: str
     agent_name: str
     run_id: str
-    should_exit: bool
-    node_name: str
-    is_finished: bool
-    predict_state_configuration: Dict[str, PredictStateConfig]
-    predicted_state: Dict[str, Any]
-    argument_buffer: str
-    current_tool_call: Optional[str]
-    state: Dict[str, Any]
-
-_CONTEXT_QUEUE = contextvars.ContextVar('queue', default=None)
-_CONTEXT_EXECUTION = contextvars.ContextVar('execution', default=None)
-
-def get_context_queue() -> asyncio.Queue:
+    should_exit: bool = False
+    node_name: str = ""
+    is_finished: bool = False
+    predict_state_configuration: Dict[str, PredictStateConfig] = field(
+        default_factory=dict)
+    predicted_state: Dict[str, Any] = field(default_factory=dict)
+    argument_buffer: str = ""
+    incremental_parser: Optional[IncrementalToolArgsParser] = None
+    predict_state_entries: List[Any] = field(default_factory=list)
+    predict_state_dirty: bool = False
+    last_predict_emit: float = 0.0
+    current_tool_call: Optional[str] = None
+    state: Dict[str, Any] = field(default_factory=dict)
+
+# Optional로 정확히 타이핑하면 set/get 경계의 cast()가 필요 없다
+_CONTEXT_QUEUE: contextvars.ContextVar[Optional[_EventChannel]] = \
+    contextvars.ContextVar('queue', default=None)
+_CONTEXT_EXECUTION: contextvars.ContextVar[Optional[CopilotKitRunExecution]] = \
+    contextvars.ContextVar('execution', default=None)
+
+def get_context_queue() -> _EventChannel:
     """
     현재 태스크의 컨텍스트에서 이벤트 큐를 가져오는 함수
 
@@ -451,7 +566,7 @@ def get_context_queue() -> asyncio.Queue:
 
     Returns
     -------
-    asyncio.Queue
+    _EventChannel
         현재 컨텍스트의 이벤트 큐
 
     Raises
@@ -472,24 +587,35 @@ def get_context_queue() -> asyncio.Queue:
     - 일반적으로 직접 호출하지 않고 queue_put() 사용
     - copilotkit_run()이 자동으로 큐를 설정합니다
     - 비동기 컨텍스트 변수로 스레드 안전 보장
+    - 첫 조회 결과를 현재 태스크 객체에 메모이즈하여 이후 호출은
+      ContextVar의 HAMT 탐색 없이 속성 조회 한 번으로 끝납니다.
+      큐는 copilotkit_run() 한 번의 수명 동안 불변이며, 런이 끝나면
+      copilotkit_run()이 메모를 무효화하므로 같은 태스크가 다음 런에
+      참여해도 죽은 채널을 재사용하지 않습니다.
 
     See Also
     --------
     set_context_queue : 컨텍스트 큐 설정
     queue_put : 이벤트를 큐에 넣는 권장 방법
     """
+    task = asyncio.current_task()
+    q = getattr(task, "_copilotkit_queue", None)
+    if q is not None:
+        return q
     q = _CONTEXT_QUEUE.get()
     if q is None:
         raise RuntimeError("No context queue is set!")
+    if task is not None:
+        task._copilotkit_queue = q  # type: ignore[attr-defined]
     return q
 
-def set_context_queue(q: asyncio.Queue) -> contextvars.Token:
+def set_context_queue(q: _EventChannel) -> contextvars.Token:
     """
     현재 태스크의 컨텍스트에 이벤트 큐를 설정하는 함수
 
     Parameters
     ----------
-    q : asyncio.Queue
+    q : _EventChannel
         설정할 이벤트 큐
 
     Returns
@@ -509,7 +635,7 @@ def set_context_queue(q: asyncio.Queue) -> contextvars.Token:
     reset_context_queue : 컨텍스트 큐 리셋
     copilotkit_run : 큐 설정 및 관리
     """
-    token = _CONTEXT_QUEUE.set(cast(Any, q))
+    token = _CONTEXT_QUEUE.set(q)
     return token
 
 def reset_context_queue(token: contextvars.Token):
@@ -550,8 +676,8 @@ def get_context_execution() -> CopilotKitRunExecution:
     --------
     >>> async def my_action_handler():
     ...     execution = get_context_execution()
-    ...     print(f"Thread ID: {execution['thread_id']}")
-    ...     print(f"Current state: {execution['state']}")
+    ...     print(f"Thread ID: {execution.thread_id}")
+    ...     print(f"Current state: {execution.state}")
     ...     return {"result": "success"}
 
     Notes
@@ -563,9 +689,9 @@ def get_context_execution() -> CopilotKitRunExecution:
     See Also
     --------
     set_context_execution : 실행 상태 설정
-    CopilotKitRunExecution : 실행 상태 TypedDict
+    CopilotKitRunExecution : 실행 상태 데이터클래스
     """
-    return cast(CopilotKitRunExecution, _CONTEXT_EXECUTION.get())
+    return _CONTEXT_EXECUTION.get()  # type: ignore[return-value]
 
 def set_context_execution(execution: CopilotKitRunExecution) -> contextvars.Token:
     """
@@ -593,7 +719,7 @@ def set_context_execution(execution: CopilotKitRunExecution) -> contextvars.Toke
     reset_context_execution : 실행 상태 리셋
     copilotkit_run : 실행 상태 설정 및 관리
     """
-    token = _CONTEXT_EXECUTION.set(cast(Any, execution))
+    token = _CONTEXT_EXECUTION.set(execution)
     return token
 
 def reset_context_execution(token: contextvars.Token):
@@ -632,8 +758,9 @@ async def queue_put(*events: RuntimeEvent, priority: bool = False):
         큐에 넣을 이벤트들 (가변 인자)
     priority : bool, default=False
         우선순위 플래그
-        True: 즉시 큐에 넣음 (긴급 이벤트용)
-        False: yield_control() 후 넣음 (일반 이벤트용)
+        True: 우선순위 deque에 넣어 이미 쌓인 일반 이벤트를 추월하며,
+        틱 양보 없이 즉시 반환 (긴급 이벤트용)
+        False: 일반 deque에 넣고 yield_control() 호출 (일반 이벤트용)
 
     Examples
     --------
@@ -661,10 +788,18 @@ async def queue_put(*events: RuntimeEvent, priority: bool = False):
     - yield_control()을 통해 이벤트 루프 제어권 양보
 
     동작 원리:
-    1. priority=False: yield_control() 호출 (우선순위 이벤트 먼저 처리 기회 제공)
-    2. get_context_queue()로 큐 가져오기
-    3. 모든 이벤트를 순서대로 큐에 넣기
-    4. yield_control() 호출 (reader가 이벤트 처리할 기회 제공)
+    1. get_context_queue()로 큐 가져오기
+    2. 모든 이벤트를 put으로 순서대로 큐에 넣기 — 채널이 가득 찬
+       경우에만 자리가 날 때까지 대기(역압)하고, 평상시에는 이벤트당
+       스케줄러 틱 없이 즉시 반환
+    3. priority=False: yield_control() 한 번 호출 (reader가 이벤트를
+       처리할 기회 제공)
+
+    호출당 이벤트 루프 틱은 이벤트 개수와 무관하게 최대 1회입니다.
+    START/CONTENT/END 같은 3-이벤트 버스트도 틱 하나로 끝나므로
+    스케줄러 왕복(call_soon + Future)이 per-event 비용에서 빠집니다.
+    priority=True는 틱 없이 즉시 반환되어 소비자보다 먼저 다음
+    이벤트를 넣을 수 있습니다.
 
     Raises
     ------
@@ -677,41 +812,19 @@ async def queue_put(*events: RuntimeEvent, priority: bool = False):
     get_context_queue : 컨텍스트 큐 가져오기
     copilotkit_run : 메인 런 루프
     """
-    if not priority:
-        # yield control so that priority events can be processed first
-        await yield_control()
-
     q = get_context_queue()
+    put = q.put
     for event in events:
-        await q.put(event)
-
-    # yield control so that the reader can process the event
-    await yield_control()
-
-
-def _to_dict_if_pydantic(obj):
-    """
-    Pydantic 모델을 딕셔너리로 변환하는 내부 유틸리티 함수
+        # 채널이 가득 찼을 때만 실제로 대기 (역압); 그 외에는 즉시 반환
+        await put(event, priority)
 
-    Parameters
-    ----------
-    obj : Any
-        변환할 객체
+    if not priority:
+        # yield control so that the reader can process the events
+        await yield_control()
 
-    Returns
-    -------
-    Any
-        Pydantic BaseModel인 경우 model_dump() 결과
-        그 외의 경우 원본 객체
 
-    Notes
-    -----
-    - _filter_state()에서 내부적으로 사용
-    - Pydantic v2 model_dump() 사용
-    """
-    if isinstance(obj, BaseModel):
-        return obj.model_dump()
-    return obj
+# AgentStateMessage로 전송하지 않는 기본 제외 키
+_DEFAULT_EXCLUDE = frozenset(("messages", "id"))
 
 def _filter_state(
         *,
@@ -760,16 +873,16 @@ def _filter_state(
     Notes
     -----
     - "messages"와 "id"는 클라이언트로 전송 불필요
-    - Pydantic 모델은 자동으로 딕셔너리로 변환
+    - Pydantic 모델은 model_dump(exclude=...)로 변환과 필터링을 한 번에
+      수행 (전체 덤프 후 재필터링하는 이중 할당 없음)
     - handle_runtime_event()에서 내부적으로 사용
-
-    See Also
-    --------
-    _to_dict_if_pydantic : Pydantic 모델 변환
     """
-    state = _to_dict_if_pydantic(state)
-    exclude_keys = exclude_keys or ["messages", "id"]
-    return {k: v for k, v in state.items() if k not in exclude_keys}
+    exclude = _DEFAULT_EXCLUDE if exclude_keys is None else set(exclude_keys)
+    if isinstance(state, BaseModel):
+        # pydantic v2는 exclude를 네이티브로 지원하므로 덤프 단계에서
+        # 바로 키를 떨어뜨린다 (단일 패스, 단일 할당)
+        return state.model_dump(exclude=exclude)
+    return {k: v for k, v in state.items() if k not in exclude}
 
 
 async def copilotkit_run(
@@ -798,6 +911,12 @@ async def copilotkit_run(
         JSON Lines 형식의 이벤트 문자열
         각 yield는 하나 이상의 JSON 라인 포함
 
+        yield 하나가 ASGI send(즉 소켓 쓰기) 하나에 대응하므로,
+        한 번에 처리된 이벤트 버스트는 이미 단일 버퍼로 합쳐져
+        나갑니다 (emit_runtime_events가 한 문자열로 직렬화).
+        소비자 루프는 반복마다 채널에 쌓인 이벤트를 전부 비워
+        결과 JSON 라인들을 하나의 yield로 묶습니다
+
     Examples
     --------
     기본 사용법:
@@ -871,39 +990,82 @@ async def copilotkit_run(
     --------
     queue_put : 이벤트를 큐에 넣는 함수
     handle_runtime_event : 이벤트 처리 로직
-    CopilotKitRunExecution : 실행 상태 TypedDict
+    CopilotKitRunExecution : 실행 상태 데이터클래스
     """
-    local_queue = asyncio.Queue()
+    local_queue = _EventChannel()
     token_queue = set_context_queue(local_queue)
     token_execution = set_context_execution(execution)
 
     task = asyncio.create_task(
         fn()
     )
+    # 에이전트 태스크의 큐 메모를 생성 시점에 선설정
+    # (get_context_queue()의 첫 ContextVar 탐색도 생략)
+    task._copilotkit_queue = local_queue  # type: ignore[attr-defined]
     try:
-        while True:
-            event = await local_queue.get()
-            local_queue.task_done()
+        # 루프 바깥에서 로컬로 바인딩: 반복마다 LOAD_GLOBAL/LOAD_ATTR
+        # 대신 LOAD_FAST 한 번으로 끝남 (이벤트당 고정비 절감)
+        _get = local_queue.get
+        _drain = local_queue.drain
+        _handle = handle_runtime_event
+        _yield = yield_control
 
-            json_lines = handle_runtime_event(
+        while True:
+            event = await _get()
+            # 첫 이벤트를 기다린 뒤 이미 쌓여 있는 나머지를 한 번에
+            # 비운다: 토큰 스트림 버스트가 제너레이터 재개(yield) 한 번에
+            # 묶여 나가므로 SSE 레이어 왕복이 이벤트 수가 아니라
+            # 루프 반복 수에 비례한다
+            batch = _drain()
+
+            json_lines = _handle(
                 event=event,
                 execution=execution
             )
+            if batch:
+                parts = [json_lines] if json_lines is not None else []
+                for event in batch:
+                    json_lines = _handle(
+                        event=event,
+                        execution=execution
+                    )
+                    if json_lines is not None:
+                        parts.append(json_lines)
+                json_lines = "".join(parts) if parts else None
 
-            if json_lines is not None:
+            if json_lines:
                 yield json_lines
 
-            if execution["is_finished"]:
+            if execution.is_finished:
                 break
 
             # return control to the containing run loop to send events
-            await yield_control()
+            await _yield()
 
-        await task
+        # RUN_FINISHED를 보낸 에이전트 태스크는 보통 이미 종료 상태라
+        # 스케줄러 왕복 없이 바로 빠져나간다; 미완료일 때만 기다린다.
+        # result()는 완료된 태스크의 예외를 await와 동일하게 전파한다.
+        if task.done():
+            task.result()
+        else:
+            await task
 
     finally:
         reset_context_queue(token_queue)
         reset_context_execution(token_execution)
+        # 이번 런의 채널을 가리키는 태스크 메모를 무효화: 같은 태스크가
+        # 다음 런(순차 실행 또는 중첩 copilotkit_run)에 참여할 때
+        # 죽은 채널을 재사용하지 않고 리셋된 ContextVar로 다시 조회한다
+        for memo_task in (task, asyncio.current_task()):
+            if memo_task is not None and \
+                    getattr(memo_task, "_copilotkit_queue", None) is local_queue:
+                del memo_task._copilotkit_queue  # type: ignore[attr-defined]
+        # RUN_FINISHED/RUN_ERROR 핸들러도 같은 정리를 하지만, 클라이언트가
+        # 연결을 끊으면 제너레이터가 그 전에 닫히므로(aclose) 여기서도
+        # 실행별 캐시를 비워 중단된 런의 상태가 고정되지 않게 한다.
+        _STATE_JSON_CACHE.pop(id(execution), None)
+        _STATE_DUMP_CACHE.pop(id(execution), None)
+        _MERGED_STATE_CACHE.pop(id(execution), None)
 
 def handle_runtime_event(
         *,
@@ -944,14 +1106,14 @@ def handle_runtime_event(
     - 예측 상태가 있으면 AgentStateMessage 추가 전송
 
     **Meta Events** (설정 업데이트, 전송 안 함):
-    - PREDICT_STATE: execution["predict_state_configuration"] 업데이트
-    - EXIT: execution["should_exit"] 업데이트
+    - PREDICT_STATE: execution.predict_state_configuration 업데이트
+    - EXIT: execution.should_exit 업데이트
 
     **Lifecycle Events** (상태 추적):
-    - RUN_STARTED: execution["state"] 초기화
+    - RUN_STARTED: execution.state 초기화
     - NODE_STARTED: node_name, state 업데이트 → AgentStateMessage 전송 (active=True)
     - NODE_FINISHED: 예측 상태 초기화, state 업데이트 → AgentStateMessage 전송 (active=False)
-    - RUN_FINISHED: execution["is_finished"] = True (런 루프 종료)
+    - RUN_FINISHED: execution.is_finished = True (런 루프 종료)
     - RUN_ERROR: 에러 출력, is_finished = True
 
     Examples
@@ -973,7 +1135,7 @@ def handle_runtime_event(
     >>> result = handle_runtime_event(event=event, execution=execution)
     >>> print(result)
     None
-    >>> print(execution["predict_state_configuration"])
+    >>> print(execution.predict_state_configuration)
     {'user_name': {'tool_name': 'update_user', 'tool_argument': 'name'}}
 
     Lifecycle Event 처리:
@@ -985,7 +1147,7 @@ def handle_runtime_event(
     ... }
     >>> json_lines = handle_runtime_event(event=event, execution=execution)
     >>> # AgentStateMessage가 반환됨
-    >>> print(execution["node_name"])
+    >>> print(execution.node_name)
     'agent_node'
 
     Notes
@@ -1009,112 +1171,253 @@ def handle_runtime_event(
     emit_runtime_events : JSON Lines 직렬화
     _filter_state : 상태 필터링 (messages, id 제외)
     """
-
-    if event["type"] in [
-        RuntimeEventTypes.TEXT_MESSAGE_START,
-        RuntimeEventTypes.TEXT_MESSAGE_CONTENT,
-        RuntimeEventTypes.TEXT_MESSAGE_END,
-        RuntimeEventTypes.ACTION_EXECUTION_START,
-        RuntimeEventTypes.ACTION_EXECUTION_ARGS,
-        RuntimeEventTypes.ACTION_EXECUTION_END,
-        RuntimeEventTypes.ACTION_EXECUTION_RESULT,
-        RuntimeEventTypes.AGENT_STATE_MESSAGE
-    ]:
-        events: List[RuntimeProtocolEvent] = [cast(RuntimeProtocolEvent, event)]
-        if event["type"] in [
-            RuntimeEventTypes.ACTION_EXECUTION_START,
-            RuntimeEventTypes.ACTION_EXECUTION_ARGS
-        ]:
-            message = predict_state(
-                thread_id=execution["thread_id"],
-                agent_name=execution["agent_name"],
-                run_id=execution["run_id"],
-                event=event,
-                execution=execution,
-            )
-            if message is not None:
-                events.append(message)
-        return emit_runtime_events(*events)
-
-    if event["type"] == RuntimeEventTypes.META_EVENT:
-        if event["name"] == RuntimeMetaEventName.PREDICT_STATE:
-            execution["predict_state_configuration"] = event["value"]
-            return None
-        if event["name"] == RuntimeMetaEventName.EXIT:
-            execution["should_exit"] = event["value"]
-            return None
-        return None
-
-    if event["type"] == RuntimeEventTypes.RUN_STARTED:
-        execution["state"] = event["state"]
+    # 타입 태그 → 핸들러 테이블로 O(1) 디스패치: 선형 if/elif 캐스케이드는
+    # 이벤트마다 리스트 멤버십 검사와 최대 ~10번의 비교를 치렀다.
+    # RuntimeEventTypes는 str-Enum이므로 Enum 멤버로 만들어진 라이프사이클
+    # 이벤트도 같은 문자열 키에 해시된다
+    handler = _EVENT_HANDLERS.get(event["type"])
+    if handler is None:
         return None
-
-    if event["type"] == RuntimeEventTypes.NODE_STARTED:
-        execution["node_name"] = event["node_name"]
-        execution["state"] = event["state"]
-
-        return emit_runtime_event(
-            agent_state_message(
-                thread_id=execution["thread_id"],
-                agent_name=execution["agent_name"],
-                node_name=execution["node_name"],
-                run_id=execution["run_id"],
-                active=True,
-                role="assistant",
-                state=json.dumps(_filter_state(state=execution["state"])),
-                running=True
-            )
+    return handler(event, execution)
+
+# 실행별 상태 직렬화 캐시: id(execution) → (state 객체, 인코딩 결과)
+# 상태 객체가 같은 참조로 반복 보고되면(노드가 상태를 제자리 변경 없이
+# 넘기는 경우) 필터링+JSON 인코딩을 건너뛴다. state 참조를 값에 함께
+# 고정(pin)하므로 id 재사용으로 인한 오염은 `is` 비교가 걸러낸다.
+# CrewAI처럼 하나의 state 객체를 런 내내 제자리에서 변경하는 생산자가
+# 있으므로, `is` 비교만으로는 최신 여부를 알 수 없다 — 라이프사이클
+# 핸들러가 execution.state를 재할당할 때마다 항목을 무효화해, 재사용을
+# 라이프사이클 이벤트 사이 구간으로 한정한다.
+# 항목은 RUN_FINISHED/RUN_ERROR 및 copilotkit_run 종료 시 제거된다
+_STATE_JSON_CACHE: Dict[int, Any] = {}
+
+def _encode_filtered_state(execution: "CopilotKitRunExecution") -> str:
+    """실행 상태를 필터링해 JSON으로 인코딩합니다 (동일 참조면 캐시 재사용)."""
+    state = execution.state
+    cached = _STATE_JSON_CACHE.get(id(execution))
+    if cached is not None and cached[0] is state:
+        return cached[1]
+    encoded = encode_state(_filter_state(state=state))
+    _STATE_JSON_CACHE[id(execution)] = (state, encoded)
+    return encoded
+
+# 실행별 state model_dump 캐시: id(execution) → (state 참조, dump 결과)
+# 하나의 툴 호출 동안 state는 노드 전이 전까지 같은 객체이므로, ARGS
+# 청크마다 Pydantic 필드 전체를 재귀 순회하는 model_dump를 반복하지
+# 않는다. 같은 객체가 제자리 변경된 채 다시 보고될 수 있으므로(CrewAI),
+# 참조 비교에 의존하지 않고 라이프사이클 핸들러가 execution.state를
+# 재할당할 때마다 함께 무효화된다.
+_STATE_DUMP_CACHE: Dict[int, Any] = {}
+
+def _dump_state(execution: "CopilotKitRunExecution") -> Dict[str, Any]:
+    """실행 상태를 dict로 반환합니다 (BaseModel이면 동일 참조 캐시 재사용)."""
+    state = execution.state
+    if not isinstance(state, BaseModel):
+        return state
+    cached = _STATE_DUMP_CACHE.get(id(execution))
+    if cached is not None and cached[0] is state:
+        return cached[1]
+    dumped = state.model_dump()
+    _STATE_DUMP_CACHE[id(execution)] = (state, dumped)
+    return dumped
+
+# 실행별 병합 상태 캐시: id(execution) → (기반 dump 참조, 병합 dict)
+# {**dump, **predicted}는 청크마다 dict 두 개를 새로 만든다. 같은 툴
+# 호출 동안 기반 dump는 동일 객체이므로 병합 dict를 한 번만 만들어
+# 두고 predicted_state만 덧씌운다. 노드 전이 시 라이프사이클 핸들러가
+# dump 캐시와 함께 이 캐시도 비우고, predicted_state도 전이 시점에
+# 함께 비워지므로 오래된 예측 키가 남지 않는다.
+_MERGED_STATE_CACHE: Dict[int, Any] = {}
+
+def _merged_state(execution: "CopilotKitRunExecution") -> Dict[str, Any]:
+    """state dump 위에 predicted_state를 덧씌운 dict를 반환합니다 (재사용)."""
+    base = _dump_state(execution)
+    cached = _MERGED_STATE_CACHE.get(id(execution))
+    if cached is not None and cached[0] is base:
+        merged = cached[1]
+    else:
+        merged = dict(base)
+        _MERGED_STATE_CACHE[id(execution)] = (base, merged)
+    merged.update(execution.predicted_state)
+    return merged
+
+# predict_state를 추가로 태울 프로토콜 이벤트 태그
+# (END는 디바운스로 눌러둔 마지막 예측 상태를 플러시하기 위해 포함)
+_PREDICTIVE_EVENT_TYPES = frozenset((
+    RuntimeEventTypes.ACTION_EXECUTION_START.value,
+    RuntimeEventTypes.ACTION_EXECUTION_ARGS.value,
+    RuntimeEventTypes.ACTION_EXECUTION_END.value,
+))
+
+# 연속 ARGS 청크의 예측 상태 방출을 묶는 디바운스 윈도우 (초).
+# LLM 토큰 스트림은 초당 수십 청크씩 도착한다 — 청크마다 전체 상태를
+# 직렬화해 보내면 다운스트림(SSE/클라이언트 렌더링)이 토큰 속도로
+# 두들겨 맞는다. 첫 변경은 즉시 나가고, 이후 변경은 윈도우가 지나거나
+# ACTION_EXECUTION_END가 올 때 합쳐져 나간다.
+_PREDICT_DEBOUNCE_S = 0.05
+
+def _handle_protocol_event(
+        event: RuntimeEvent,
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """프로토콜 이벤트를 직렬화합니다 (START/ARGS는 상태 예측 포함)."""
+    message = None
+    # 예측 설정이 비어 있으면(기본) 버퍼 누적과 부분 JSON 파싱 자체를 건너뜀
+    if execution.predict_state_configuration and event["type"] in _PREDICTIVE_EVENT_TYPES:
+        message = predict_state(
+            thread_id=execution.thread_id,
+            agent_name=execution.agent_name,
+            run_id=execution.run_id,
+            event=event,
+            execution=execution,
         )
+    # 지배적인 경로(텍스트 이벤트, 예측 없음)는 리스트/가변 인자 없이 단건 직렬화
+    if message is None:
+        return emit_runtime_event(cast(RuntimeProtocolEvent, event))
+    return emit_runtime_events(cast(RuntimeProtocolEvent, event), message)
 
-    if event["type"] == RuntimeEventTypes.NODE_FINISHED:
-
-        # reset the predict state configuration at the end of the method execution
-        execution["predict_state_configuration"] = {}
-        execution["current_tool_call"] = None
-        execution["argument_buffer"] = ""
-        execution["predicted_state"] = {}
-        execution["state"] = event["state"]
-
-        return emit_runtime_event(
-            agent_state_message(
-                thread_id=execution["thread_id"],
-                agent_name=execution["agent_name"],
-                node_name=execution["node_name"],
-                run_id=execution["run_id"],
-                active=False,
-                role="assistant",
-                state=json.dumps(_filter_state(state=execution["state"])),
-                running=True
-            )
+def _handle_meta_event(
+        event: RuntimeEvent,
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """메타 이벤트로 실행 설정을 갱신합니다 (클라이언트 전송 없음)."""
+    if event["name"] == RuntimeMetaEventName.PREDICT_STATE.value:
+        execution.predict_state_configuration = event["value"]
+    elif event["name"] == RuntimeMetaEventName.EXIT.value:
+        execution.should_exit = event["value"]
+    return None
+
+def _handle_run_started(
+        event: RuntimeEvent,
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """RUN_STARTED: 초기 상태를 기록합니다."""
+    execution.state = event["state"]
+    _STATE_JSON_CACHE.pop(id(execution), None)
+    _STATE_DUMP_CACHE.pop(id(execution), None)
+    _MERGED_STATE_CACHE.pop(id(execution), None)
+    return None
+
+def _handle_node_started(
+        event: RuntimeEvent,
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """NODE_STARTED: 노드/상태를 갱신하고 AgentStateMessage를 내보냅니다."""
+    # 갱신 직후 같은 값을 다시 조회하지 않도록 로컬에 바인딩
+    node_name = event["node_name"]
+    execution.node_name = node_name
+    execution.state = event["state"]
+    # 같은 state 객체가 제자리 변경되어 다시 보고될 수 있으므로 재할당
+    # 시점마다 상태 파생 캐시를 모두 무효화한다 (인코딩은 아래에서 즉시
+    # 재계산되고, dump/병합 캐시는 다음 ARGS 청크에서 재구성된다)
+    _STATE_JSON_CACHE.pop(id(execution), None)
+    _STATE_DUMP_CACHE.pop(id(execution), None)
+    _MERGED_STATE_CACHE.pop(id(execution), None)
+
+    return emit_runtime_event(
+        agent_state_message(
+            thread_id=execution.thread_id,
+            agent_name=execution.agent_name,
+            node_name=node_name,
+            run_id=execution.run_id,
+            active=True,
+            role="assistant",
+            state=_encode_filtered_state(execution),
+            running=True
         )
+    )
 
-    if event["type"] == RuntimeEventTypes.RUN_FINISHED:
-        execution["is_finished"] = True
-        return None
-
-    if event["type"] == RuntimeEventTypes.RUN_ERROR:
-        print("Flow execution error", flush=True)
-        error_info = event["error"]
-
-        if isinstance(error_info, Exception):
-            # If it's an exception, print the traceback
-            print("Exception occurred:", flush=True)
-            print(
-                ''.join(
-                    traceback.format_exception(
-                        None,
-                        error_info,
-                        error_info.__traceback__
-                    )
-                ),
-                flush=True
-            )
-        else:
-            # Otherwise, assume it's a string and print it
-            print(error_info, flush=True)
+def _handle_node_finished(
+        event: RuntimeEvent,
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """NODE_FINISHED: 예측 상태를 초기화하고 AgentStateMessage를 내보냅니다."""
+    # reset the predict state configuration at the end of the method execution
+    execution.predict_state_configuration = {}
+    execution.current_tool_call = None
+    execution.argument_buffer = ""
+    execution.incremental_parser = None
+    execution.predict_state_entries = []
+    execution.predict_state_dirty = False
+    execution.predicted_state = {}
+    execution.state = event["state"]
+    _STATE_JSON_CACHE.pop(id(execution), None)
+    _STATE_DUMP_CACHE.pop(id(execution), None)
+    _MERGED_STATE_CACHE.pop(id(execution), None)
+
+    return emit_runtime_event(
+        agent_state_message(
+            thread_id=execution.thread_id,
+            agent_name=execution.agent_name,
+            node_name=execution.node_name,
+            run_id=execution.run_id,
+            active=False,
+            role="assistant",
+            state=_encode_filtered_state(execution),
+            running=True
+        )
+    )
 
-        execution["is_finished"] = True
-        return None
+def _handle_run_finished(
+        event: RuntimeEvent,  # pylint: disable=unused-argument
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """RUN_FINISHED: 런 루프 종료 플래그를 설정합니다."""
+    execution.is_finished = True
+    _STATE_JSON_CACHE.pop(id(execution), None)
+    _STATE_DUMP_CACHE.pop(id(execution), None)
+    _MERGED_STATE_CACHE.pop(id(execution), None)
+    return None
+
+def _handle_run_error(
+        event: RuntimeEvent,
+        execution: CopilotKitRunExecution
+) -> Optional[str]:
+    """RUN_ERROR: 에러를 출력하고 런 루프를 종료합니다."""
+    print("Flow execution error", flush=True)
+    error_info = event["error"]
+
+    if isinstance(error_info, Exception):
+        # If it's an exception, print the traceback
+        # (print_exception은 스트림에 바로 쓰므로 중간 문자열/join이 없음)
+        print("Exception occurred:", flush=True)
+        traceback.print_exception(
+            None,
+            error_info,
+            error_info.__traceback__,
+            file=sys.stdout,
+        )
+        sys.stdout.flush()
+    else:
+        # Otherwise, assume it's a string and print it
+        print(error_info, flush=True)
+
+    execution.is_finished = True
+    _STATE_JSON_CACHE.pop(id(execution), None)
+    _STATE_DUMP_CACHE.pop(id(execution), None)
+    _MERGED_STATE_CACHE.pop(id(execution), None)
+    return None
+
+# 타입 태그 → 핸들러 테이블 (임포트 시 한 번 구성)
+# 프로토콜 이벤트 8종은 모두 같은 직렬화 핸들러를 공유한다
+_EVENT_HANDLERS: Dict[str, Callable[
+    [RuntimeEvent, CopilotKitRunExecution], Optional[str]
+]] = {
+    RuntimeEventTypes.TEXT_MESSAGE_START.value: _handle_protocol_event,
+    RuntimeEventTypes.TEXT_MESSAGE_CONTENT.value: _handle_protocol_event,
+    RuntimeEventTypes.TEXT_MESSAGE_END.value: _handle_protocol_event,
+    RuntimeEventTypes.ACTION_EXECUTION_START.value: _handle_protocol_event,
+    RuntimeEventTypes.ACTION_EXECUTION_ARGS.value: _handle_protocol_event,
+    RuntimeEventTypes.ACTION_EXECUTION_END.value: _handle_protocol_event,
+    RuntimeEventTypes.ACTION_EXECUTION_RESULT.value: _handle_protocol_event,
+    RuntimeEventTypes.AGENT_STATE_MESSAGE.value: _handle_protocol_event,
+    RuntimeEventTypes.META_EVENT.value: _handle_meta_event,
+    RuntimeEventTypes.RUN_STARTED.value: _handle_run_started,
+    RuntimeEventTypes.NODE_STARTED.value: _handle_node_started,
+    RuntimeEventTypes.NODE_FINISHED.value: _handle_node_finished,
+    RuntimeEventTypes.RUN_FINISHED.value: _handle_run_finished,
+    RuntimeEventTypes.RUN_ERROR.value: _handle_run_error,
+}
 
 def predict_state(
         *,
@@ -1157,11 +1460,10 @@ def predict_state(
        - argument_buffer = "" (초기화)
 
     2. **ACTION_EXECUTION_ARGS 처리**:
-       - argument_buffer에 인자 청크 누적
-       - 현재 tool_call이 predict_state_configuration에 있는지 확인
-       - PartialJSONParser로 불완전한 JSON 파싱 시도
-       - predict_state_configuration 순회:
-         - tool_name 일치 확인
+       - predict_state_entries가 비어 있으면(감시 대상 아님) 즉시 반환
+       - incremental_parser에 새 청크(델타)만 공급
+       - 파서의 args 딕셔너리에서 (부분) 인자 조회 — 버퍼 재파싱 없음
+       - predict_state_entries 순회 (해당 툴의 설정만):
          - tool_argument 지정된 경우: 해당 인자 값만 추출
          - tool_argument 없는 경우: 전체 인자 객체 사용
          - predicted_state[state_key] = 추출된 값
@@ -1195,7 +1497,7 @@ def predict_state(
     ...     "actionName": "update_user"
     ... }
     >>> result = predict_state(..., event=event_start, execution=execution)
-    >>> # current_tool_call = "update_user", argument_buffer = ""
+    >>> # current_tool_call = "update_user", 새 incremental_parser 생성
 
     >>> # 2. ACTION_EXECUTION_ARGS (첫 청크)
     >>> event_args1 = {
@@ -1203,7 +1505,7 @@ def predict_state(
     ...     "args": '{"name": "Al'
     ... }
     >>> result = predict_state(..., event=event_args1, execution=execution)
-    >>> # PartialJSONParser 파싱 실패 또는 부분 파싱 → None or partial update
+    >>> # 부분 파싱: parser.args == {"name": "Al"} → partial update
 
     >>> # 3. ACTION_EXECUTION_ARGS (두 번째 청크)
     >>> event_args2 = {
@@ -1211,8 +1513,7 @@ def predict_state(
     ...     "args": 'ice", "email": "alice@'
     ... }
     >>> result = predict_state(..., event=event_args2, execution=execution)
-    >>> # 누적: '{"name": "Alice", "email": "alice@'
-    >>> # Partial 파싱 성공 → {"name": "Alice"}
+    >>> # parser.args == {"name": "Alice", "email": "alice@"}
     >>> # predicted_state["user_name"] = "Alice"
     >>> # AgentStateMessage 반환
 
@@ -1222,8 +1523,7 @@ def predict_state(
     ...     "args": 'example.com"}'
     ... }
     >>> result = predict_state(..., event=event_args3, execution=execution)
-    >>> # 누적: '{"name": "Alice", "email": "alice@example.com"}'
-    >>> # 완전한 JSON 파싱 성공
+    >>> # parser.args == {"name": "Alice", "email": "alice@example.com"}
     >>> # predicted_state["user_name"] = "Alice"
     >>> # predicted_state["user_email"] = "alice@example.com"
     >>> # AgentStateMessage 반환
@@ -1231,8 +1531,8 @@ def predict_state(
     Notes
     -----
     Partial JSON Parsing:
-    - 불완전한 JSON 문자열도 파싱 가능
-    - 닫히지 않은 중괄호, 따옴표 처리
+    - 불완전한 JSON 문자열도 파싱 가능 (진행 중 문자열은 부분 노출)
+    - 토크나이저 상태를 청크 사이에 유지: 청크당 O(델타), 전체 O(N)
     - 파싱 실패 시 None 반환 (예외 무시)
 
     State Merging:
@@ -1254,63 +1554,112 @@ def predict_state(
     --------
     handle_runtime_event : predict_state() 호출
     copilotkit_customize_config : predict_state 설정 데코레이터
-    PartialJSONParser : 부분 JSON 파싱 라이브러리
+    IncrementalToolArgsParser : 증분 툴 인자 파서 (copilotkit._incremental_json)
     """
     
-    if event["type"] == RuntimeEventTypes.ACTION_EXECUTION_START:
-        execution["current_tool_call"] = event["actionName"]
-        execution["argument_buffer"] = ""
-    elif event["type"] == RuntimeEventTypes.ACTION_EXECUTION_ARGS:
-        execution["argument_buffer"] += event["args"]
-
-        tool_names = [
-            config.get("tool_name")
-            for config in execution["predict_state_configuration"].values()
+    if event["type"] == RuntimeEventTypes.ACTION_EXECUTION_START.value:
+        tool_name = event["actionName"]
+        execution.current_tool_call = tool_name
+        execution.argument_buffer = ""
+        execution.incremental_parser = IncrementalToolArgsParser()
+        # 설정은 툴 호출 수명 동안 불변이므로 여기서 한 번만 추려둔다
+        execution.predict_state_entries = [
+            (k, v)
+            for k, v in execution.predict_state_configuration.items()
+            if v.get("tool_name") == tool_name
         ]
-
-        if execution["current_tool_call"] not in tool_names:
+        # 새 툴 호출의 첫 업데이트는 디바운스 없이 즉시 나가도록 리셋
+        execution.predict_state_dirty = False
+        execution.last_predict_emit = 0.0
+    elif event["type"] == RuntimeEventTypes.ACTION_EXECUTION_ARGS.value:
+        entries = execution.predict_state_entries
+        if not entries:
             return None
 
-        current_arguments = {}
+        parser = execution.incremental_parser
+        if parser is None:
+            parser = execution.incremental_parser = IncrementalToolArgsParser()
+
+        # 델타만 소비: 토크나이저 상태는 parser가 호출 사이에 유지
+        # (파서는 잘못된 입력에 ValueError만 던진다 — 넓은 except로
+        #  KeyboardInterrupt/MemoryError까지 삼키지 않는다)
         try:
-            current_arguments = PartialJSONParser().parse(execution["argument_buffer"])
-        except:  # pylint: disable=bare-except
+            changed = parser.feed(event["args"])
+        except ValueError:
+            return None
+
+        # 이번 청크가 관찰 가능한 인자를 바꾸지 못했다면(키 문자열 중간,
+        # 잘린 숫자, 공백 등 구조적으로 의미 없는 델타) 값 추출과 상태
+        # 병합/직렬화를 통째로 건너뜀
+        if not changed:
             return None
 
+        current_arguments = parser.args
+
         emit_update = False
-        for k, v in execution["predict_state_configuration"].items():
-            if v["tool_name"] == execution["current_tool_call"]:
-                tool_argument = v.get("tool_argument")
-                if tool_argument is not None:
-                    argument_value = current_arguments.get(tool_argument)
-                    if argument_value is not None:
-                        execution["predicted_state"][k] = argument_value
-                        emit_update = True
-                else:
-                    execution["predicted_state"][k] = current_arguments
+        predicted = execution.predicted_state
+        for k, v in entries:
+            tool_argument = v.get("tool_argument")
+            if tool_argument is not None:
+                argument_value = current_arguments.get(tool_argument)
+                if argument_value is not None:
+                    # 스칼라 값이 직전과 동일하면 재전송하지 않음 —
+                    # 감시 인자 뒤의 청크들이 같은 값으로 model_dump와
+                    # 직렬화를 반복 유발하는 것을 차단.
+                    # 가변 값(dict/list)은 파서가 제자리 갱신하므로
+                    # 동등 비교로 변화를 판별할 수 없어 항상 전송한다.
+                    if isinstance(argument_value, (str, int, float)) \
+                            and predicted.get(k) == argument_value:
+                        continue
+                    predicted[k] = argument_value
                     emit_update = True
+            else:
+                predicted[k] = current_arguments
+                emit_update = True
 
         if emit_update:
-            return agent_state_message(
-                thread_id=thread_id,
-                agent_name=agent_name,
-                node_name=execution["node_name"],
-                run_id=run_id,
-                active=True,
-                role="assistant",
-                state=json.dumps(
-                    _filter_state(
-                        state={
-                            **(
-                                execution["state"].model_dump()
-                                if isinstance(execution["state"], BaseModel)
-                                else execution["state"]
-                            ),
-                            **execution["predicted_state"]
-                        }
-                    )
-                ),
-                running=True
-            )
+            execution.predict_state_dirty = True
 
-        return None
+        if not execution.predict_state_dirty:
+            return None
+
+        # 디바운스: 직전 방출 후 윈도우가 지나지 않았으면 눌러둔다.
+        # 눌린 변경은 다음 윈도우 통과 청크 또는 END에서 합쳐져 나간다.
+        now = time.monotonic()
+        if now - execution.last_predict_emit < _PREDICT_DEBOUNCE_S:
+            return None
+
+        execution.predict_state_dirty = False
+        execution.last_predict_emit = now
+        return agent_state_message(
+            thread_id=thread_id,
+            agent_name=agent_name,
+            node_name=execution.node_name,
+            run_id=run_id,
+            active=True,
+            role="assistant",
+            state=encode_state(
+                _filter_state(state=_merged_state(execution))
+            ),
+            running=True
+        )
+    elif event["type"] == RuntimeEventTypes.ACTION_EXECUTION_END.value:
+        # 디바운스로 눌려 있던 마지막 예측 상태를 플러시
+        if not execution.predict_state_dirty:
+            return None
+        execution.predict_state_dirty = False
+        execution.last_predict_emit = time.monotonic()
+        return agent_state_message(
+            thread_id=thread_id,
+            agent_name=agent_name,
+            node_name=execution.node_name,
+            run_id=run_id,
+            active=True,
+            role="assistant",
+            state=encode_state(
+                _filter_state(state=_merged_state(execution))
+            ),
+            running=True
+        )
+
+    return None
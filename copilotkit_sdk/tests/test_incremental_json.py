@@ -0,0 +1,167 @@
+"""
+Test IncrementalToolArgsParser
+
+Tests for the streaming tool-argument JSON parser used by predict_state,
+including chunk-boundary behavior and surrogate-pair decoding of
+\\uXXXX escapes (how LLM providers stream non-BMP characters).
+"""
+import json
+import random
+
+import pytest
+
+from copilotkit._incremental_json import IncrementalToolArgsParser
+
+
+def feed_all(chunks):
+    """Feed every chunk into a fresh parser and return its args dict."""
+    parser = IncrementalToolArgsParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.args
+
+
+class TestBasicParsing:
+    """Test complete and partial documents fed in pieces"""
+
+    def test_complete_document_matches_json_loads(self):
+        doc = '{"name": "Alice", "age": 30, "tags": ["a", "b"], "ok": true}'
+        assert feed_all([doc]) == json.loads(doc)
+
+    def test_partial_string_exposed_at_feed_boundary(self):
+        parser = IncrementalToolArgsParser()
+        assert parser.feed('{"name": "Al') is True
+        assert parser.args == {"name": "Al"}
+        assert parser.feed('ice"}') is True
+        assert parser.args == {"name": "Alice"}
+
+    def test_truncated_number_not_exposed(self):
+        parser = IncrementalToolArgsParser()
+        parser.feed('{"age": 3')
+        assert parser.args == {}
+        parser.feed('0}')
+        assert parser.args == {"age": 30}
+
+    def test_whitespace_only_chunk_is_not_dirty(self):
+        parser = IncrementalToolArgsParser()
+        parser.feed('{"a": true,')
+        assert parser.feed('   ') is False
+
+    def test_empty_object_value_is_dirty(self):
+        parser = IncrementalToolArgsParser()
+        assert parser.feed('{"cfg": {}}') is True
+        assert parser.args == {"cfg": {}}
+
+    def test_empty_array_value_is_dirty(self):
+        parser = IncrementalToolArgsParser()
+        parser.feed('{"items":')
+        assert parser.feed(' []') is True
+        assert parser.args == {"items": []}
+
+    def test_nested_container_open_is_dirty(self):
+        parser = IncrementalToolArgsParser()
+        parser.feed('{"cfg": ')
+        assert parser.feed('{') is True
+        assert parser.args == {"cfg": {}}
+
+    def test_nested_containers(self):
+        doc = '{"outer": {"inner": [1, {"deep": null}]}}'
+        assert feed_all(list(doc)) == json.loads(doc)
+
+    def test_malformed_input_raises_and_stays_broken(self):
+        parser = IncrementalToolArgsParser()
+        with pytest.raises(ValueError):
+            parser.feed('{"a": 1,,')
+        with pytest.raises(ValueError):
+            parser.feed('}')
+
+
+class TestUnicodeEscapes:
+    """Test \\uXXXX decoding, especially surrogate pairs"""
+
+    def test_bmp_escape(self):
+        doc = '{"msg": "caf\\u00e9"}'
+        assert feed_all([doc]) == json.loads(doc)
+
+    def test_surrogate_pair_combined(self):
+        doc = '{"msg": "\\ud83c\\udf89 party"}'
+        assert feed_all([doc]) == {"msg": "🎉 party"}
+
+    def test_surrogate_pair_split_between_escapes(self):
+        assert feed_all(['{"msg": "\\ud83c', '\\udf89"}']) == {"msg": "🎉"}
+
+    def test_surrogate_pair_split_mid_hex(self):
+        assert feed_all(['{"msg": "\\ud83c\\udf', '89"}']) == {"msg": "🎉"}
+
+    def test_partial_exposure_never_yields_lone_surrogate(self):
+        parser = IncrementalToolArgsParser()
+        parser.feed('{"msg": "hi \\ud83c')
+        # 하이 서로게이트는 짝이 올 때까지 보류되어야 한다
+        parser.args.get("msg", "").encode("utf-8")
+        parser.feed('\\udf89"}')
+        assert parser.args == {"msg": "hi 🎉"}
+
+    def test_lone_high_surrogate_replaced(self):
+        args = feed_all(['{"msg": "\\ud83c end"}'])
+        assert args == {"msg": "� end"}
+        args["msg"].encode("utf-8")
+
+    def test_lone_low_surrogate_replaced(self):
+        args = feed_all(['{"msg": "\\udf89"}'])
+        assert args == {"msg": "�"}
+
+    def test_high_surrogate_then_bmp_escape(self):
+        args = feed_all(['{"msg": "\\ud83c\\u0041"}'])
+        assert args == {"msg": "�A"}
+
+    def test_high_surrogate_at_string_end(self):
+        args = feed_all(['{"msg": "\\ud83c"}'])
+        assert args == {"msg": "�"}
+
+    def test_raw_non_bmp_character(self):
+        doc = '{"msg": "🎉 done"}'
+        assert feed_all(list(doc)) == json.loads(doc)
+
+    def test_bad_hex_raises(self):
+        parser = IncrementalToolArgsParser()
+        with pytest.raises(ValueError):
+            parser.feed('{"msg": "\\uZZZZ"}')
+
+
+class TestFuzzAgainstJsonLoads:
+    """Randomized chunking must agree with json.loads on valid documents"""
+
+    DOCS = [
+        '{"a": 1, "b": [true, false, null], "c": {"d": "e"}}',
+        '{"msg": "\\ud83c\\udf89\\ud83d\\ude00 mixed \\u00e9"}',
+        '{"text": "line1\\nline2\\t\\"quoted\\"", "n": -3.5e2}',
+        '{"emoji": "🎉🚀", "list": ["\\ud83d\\udc4d", 1, 2.5]}',
+        '{"empty": {}, "arr": [], "s": ""}',
+    ]
+
+    def test_random_chunking(self):
+        rng = random.Random(7)
+        for doc in self.DOCS:
+            expected = json.loads(doc)
+            for _ in range(80):
+                parser = IncrementalToolArgsParser()
+                i = 0
+                while i < len(doc):
+                    step = rng.randint(1, 7)
+                    parser.feed(doc[i:i + step])
+                    i += step
+                assert parser.args == expected, doc
+
+    def test_char_at_a_time(self):
+        for doc in self.DOCS:
+            assert feed_all(list(doc)) == json.loads(doc), doc
+
+    def test_intermediate_args_always_encodable(self):
+        doc = '{"msg": "\\ud83c\\udf89\\ud83d\\ude00"}'
+        for split in range(1, len(doc)):
+            parser = IncrementalToolArgsParser()
+            parser.feed(doc[:split])
+            for value in parser.args.values():
+                value.encode("utf-8")  # 외톨이 서로게이트면 여기서 실패
+            parser.feed(doc[split:])
+            assert parser.args == json.loads(doc)
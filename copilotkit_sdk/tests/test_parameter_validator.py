@@ -0,0 +1,82 @@
+"""
+Test build_validator
+
+Tests for the compiled parameter-validation closures, including the
+edge cases around unknown type tags, None schemas and cache identity.
+"""
+import pytest
+
+from copilotkit.parameter import build_validator
+
+
+class TestBuildValidator:
+    """Test compiled validators against argument dictionaries"""
+
+    def test_required_argument_present(self):
+        validate = build_validator([{"name": "query", "type": "string"}])
+        assert validate({"query": "hello"}) == {"query": "hello"}
+
+    def test_required_argument_missing_raises(self):
+        validate = build_validator([{"name": "query", "type": "string"}])
+        with pytest.raises(ValueError, match="query"):
+            validate({})
+
+    def test_type_mismatch_raises(self):
+        validate = build_validator([{"name": "age", "type": "number"}])
+        with pytest.raises(ValueError, match="age"):
+            validate({"age": "thirty"})
+
+    def test_enum_check(self):
+        validate = build_validator([
+            {"name": "color", "type": "string", "enum": ["red", "blue"]}
+        ])
+        assert validate({"color": "red"}) == {"color": "red"}
+        with pytest.raises(ValueError, match="color"):
+            validate({"color": "green"})
+
+    def test_optional_argument_absent_is_ok(self):
+        validate = build_validator([
+            {"name": "limit", "type": "number", "required": False}
+        ])
+        assert validate({}) == {}
+        with pytest.raises(ValueError):
+            validate({"limit": "ten"})
+
+    def test_optional_unknown_type_compiles(self):
+        # "integer"는 알 수 없는 타입 태그 — 본문 없는 if 블록이 생기면
+        # 컴파일 자체가 IndentationError로 실패한다
+        validate = build_validator([
+            {"name": "x", "type": "integer", "required": False}
+        ])
+        assert validate({}) == {}
+        assert validate({"x": "anything"}) == {"x": "anything"}
+
+    def test_required_unknown_type_still_checks_presence(self):
+        validate = build_validator([{"name": "x", "type": "integer"}])
+        with pytest.raises(ValueError, match="x"):
+            validate({})
+        assert validate({"x": 1}) == {"x": 1}
+
+    def test_none_returns_shared_passthrough(self):
+        first = build_validator(None)
+        second = build_validator(None)
+        assert first is second
+        assert first({"anything": 1}) == {"anything": 1}
+
+    def test_same_list_reuses_compiled_validator(self):
+        parameters = [{"name": "query", "type": "string"}]
+        assert build_validator(parameters) is build_validator(parameters)
+
+    def test_nested_attributes_are_not_validated(self):
+        # 문서화된 범위: 최상위 파라미터만 검증하고 중첩 attributes는
+        # dict 여부까지만 확인한다
+        validate = build_validator([
+            {
+                "name": "address",
+                "type": "object",
+                "attributes": [{"name": "city", "type": "string"}],
+            }
+        ])
+        assert validate({"address": {"city": 42}}) == {"address": {"city": 42}}
+        with pytest.raises(ValueError, match="address"):
+            validate({"address": "not a dict"})